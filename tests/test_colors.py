@@ -8,6 +8,7 @@ import re
 
 import pytest
 import vtkplotlib as vpl
+from vtkplotlib import vtk
 
 from matplotlib import cm
 
@@ -111,5 +112,32 @@ def test_cmap_raises():
         vpl.colors.as_vtk_cmap(np.arange(10).reshape(5, 2))
 
 
+def test_quantize():
+    colors = np.array([[0, .5, 1], [-1, .999, 2]])
+    assert vpl.colors.quantize(colors).tolist() == [[0, 128, 255],
+                                                    [0, 255, 255]]
+    assert vpl.colors.quantize(colors).dtype == np.uint8
+
+
+def test_uint8_polydata_colors():
+    polydata = vpl.PolyData()
+    polydata.points = np.random.random((4, 3))
+    polydata.polygons = np.arange(4).reshape((1, 4))
+
+    polydata.point_colors = np.random.randint(0, 256, (4, 4)).astype(np.uint8)
+    assert polydata.point_colors.dtype == np.uint8
+    assert polydata.color_mode == vtk.VTK_COLOR_MODE_DIRECT_SCALARS
+
+    polydata.point_colors = np.arange(4, dtype=np.uint8)
+    assert polydata.color_mode == vtk.VTK_COLOR_MODE_MAP_SCALARS
+
+    polydata.quantize_colors = True
+    polydata.polygon_colors = np.array([[.2, .4, .6]])
+    assert polydata.polygon_colors.tolist() == [[51, 102, 153]]
+    # Scalars should be left alone.
+    polydata.polygon_colors = np.array([.2])
+    assert polydata.polygon_colors.dtype == float
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
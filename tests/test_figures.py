@@ -51,6 +51,24 @@ def test_figure_io():
     vpl.close()
 
 
+def test_memory_report():
+    fig = vpl.figure()
+    plot = vpl.plot(np.random.random((10, 3)), color="r", fig=fig)
+    copy = vpl.plots.BasePlot.ConstructedPlot(fig)
+    copy.polydata = plot.polydata.shallow_copy()
+    copy.connect()
+    vpl.text("no polydata", fig=fig)
+
+    report = fig.memory_report()
+    rows = report.splitlines()
+    assert rows[0].split() == ["Plot", "Array", "Bytes"]
+    assert sum("shared with Lines" in row for row in rows) == 3
+    assert rows[-1].split()[0] == "Total"
+    # Colormaps cached by other tests may also be included.
+    assert int(rows[-1].split()[1]) >= plot.nbytes
+    assert copy.nbytes == plot.nbytes
+
+
 def test_save():
     plots = vpl.scatter(np.random.uniform(-10, 10, (30, 3)))
 
@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 """Test mesh plotting."""
 
+import os
+
 import numpy as np
 
 import pytest
 import vtkplotlib as vpl
 
-from tests._common import numpy_stl
+from tests._common import numpy_stl, TEST_DIR
 
 path = vpl.data.get_rabbit_stl()
 
@@ -51,5 +53,321 @@ def test_edge_scalars():
     self.cmap = "Reds"
 
 
+def test_edge_scalars_layout():
+    vectors = np.random.random((4, 3, 3))
+    edge_scalars = np.random.random((4, 3))
+    plot = vpl.mesh_plot_with_edge_scalars(vectors, edge_scalars, fig=None)
+
+    # Triangle i's edge j becomes sub-triangle 3i + j. Its corners are the
+    # ends of the edge then the centre.
+    assert plot.vectors.shape == (12, 3, 3)
+    assert np.allclose(plot.vectors[:, 0], vectors.reshape((-1, 3)))
+    rolled = vectors[:, [1, 2, 0]]
+    assert np.allclose(plot.vectors[:, 1], rolled.reshape((-1, 3)))
+    assert np.allclose(plot.vectors[:, 2], np.repeat(vectors.mean(1), 3, 0))
+
+    assert np.allclose(plot.scalars[:, 0], edge_scalars.ravel())
+    assert np.allclose(plot.scalars[:, 1], edge_scalars.ravel())
+    assert np.allclose(plot.scalars[:, 2], np.repeat(edge_scalars.mean(1), 3))
+
+    # Only the centres are shared.
+    assert len(plot.vertices) == 7 * 4
+
+    plot = vpl.mesh_plot_with_edge_scalars(vectors, edge_scalars,
+                                           centre_scalar=-1, fig=None)
+    assert np.all(plot.scalars[:, 2] == -1)
+
+
+def test_points_dtype():
+    vectors = np.random.random((10, 3, 3))
+    plot = vpl.mesh_plot(vectors, points_dtype=np.float32, fig=None)
+    assert plot.vectors.dtype == np.float32
+    assert np.allclose(plot.vectors, vectors)
+    assert plot.polydata.points is plot.polydata.points
+
+    assert vpl.plot(vectors, points_dtype=np.float32,
+                    fig=None).vertices.dtype == np.float32
+    assert vpl.surface(*vectors.T, points_dtype=np.float32,
+                       fig=None).polydata.points.dtype == np.float32
+
+    try:
+        vpl.PolyData.points_dtype = np.float32
+        assert vpl.mesh_plot(vectors, fig=None).vectors.dtype == np.float32
+    finally:
+        vpl.PolyData.points_dtype = None
+    assert vpl.mesh_plot(vectors, fig=None).vectors.dtype == np.float64
+
+
+def test_weld():
+    # A square made of two triangles which share two corners.
+    vectors = np.array([[[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+                        [[0, 0, 0], [1, 1, 0], [0, 1, -0.]]]) # yapf: disable
+    scalars = vectors[..., 0] + vectors[..., 1]
+
+    plot = vpl.mesh_plot(vectors, scalars=scalars, tri_scalars=np.array([1, 2]),
+                         weld=True, fig=None)
+    assert plot.vertices.tolist() == [[0, 0, 0], [1, 0, 0], [1, 1, 0],
+                                      [0, 1, 0]]
+    assert plot.indices.tolist() == [[0, 1, 2], [0, 2, 3]]
+    assert np.array_equal(plot.vectors, vectors)
+    assert np.array_equal(plot.scalars, scalars)
+    assert plot.tri_scalars.ravel().tolist() == [1, 2]
+
+    # Scalars can be round-tripped per corner or given per vertex.
+    plot.scalars = plot.scalars * 2
+    assert plot.polydata.point_colors.ravel().tolist() == [0, 2, 4, 2]
+    assert np.array_equal(plot.scalars, scalars * 2)
+    plot.scalars = np.arange(4.)
+    assert plot.scalars.tolist() == [[0, 1, 2], [0, 2, 3]]
+    with pytest.raises(ValueError):
+        plot.scalars = np.arange(5.)
+
+    plot = vpl.mesh_plot(vectors + [[[0, 0, 0]], [[1e-6, 0, 0]]], fig=None)
+    plot.weld()
+    assert len(plot.vertices) == 6
+    plot.weld(tolerance=1e-3)
+    assert len(plot.vertices) == 4
+
+
+def test_weld_smooth(monkeypatch):
+    from vtkplotlib.plots import polydata
+
+    # Normals should only be calculated for the welded mesh.
+    sizes = []
+    polygon_normals = polydata._polygon_normals
+
+    def spy(points, *args):
+        sizes.append(len(points))
+        return polygon_normals(points, *args)
+
+    monkeypatch.setattr(polydata, "_polygon_normals", spy)
+    vectors = np.array([[[0, 0, 0], [1, 0, 0], [1, 1, 0]],
+                        [[0, 0, 0], [1, 1, 0], [0, 1, 0]]]) # yapf: disable
+    plot = vpl.mesh_plot(vectors, weld=True, smooth=True, fig=None)
+    assert plot.smooth
+    assert sizes == [4]
+
+
+def test_strips():
+    vectors = np.random.random((10, 3, 3))
+    plot = vpl.mesh_plot(vectors, scalars=vectors[..., 0], weld=True,
+                         strips=True, fig=None)
+    assert plot.strips
+    assert plot.mapper.GetInputAlgorithm() is plot._stripper
+
+    plot.strips = False
+    assert not plot.strips
+    assert plot.mapper.GetInput() is plot.polydata.vtk_polydata
+
+    with pytest.raises(ValueError):
+        vpl.mesh_plot(vectors, tri_scalars=np.arange(10), strips=True, fig=None)
+    plot.strips = True
+    with pytest.raises(ValueError):
+        plot.tri_scalars = np.arange(10)
+    assert plot.polydata.polygon_colors is None
+
+
+def test_set_visible_cells():
+    vectors = np.random.random((10, 3, 3))
+    plot = vpl.mesh_plot(vectors, tri_scalars=np.arange(10), fig=None)
+
+    plot.set_visible_cells(np.arange(10) % 2 == 0)
+    plot.mapper.Update()
+    shown = vpl.PolyData(plot.mapper.GetInput())
+    assert np.array_equal(shown.points[shown.polygons], vectors[::2])
+    assert shown.polygon_colors.tolist() == [0, 2, 4, 6, 8]
+    # The full mesh is untouched.
+    assert np.array_equal(plot.vectors, vectors)
+
+    # The visible subset follows changes to the mesh.
+    plot.set_visible_cells([1, 2])
+    plot.vectors = vectors + 1
+    plot.mapper.Update()
+    shown = vpl.PolyData(plot.mapper.GetInput())
+    assert np.array_equal(shown.points[shown.polygons], vectors[1:3] + 1)
+
+    # Hide everything.
+    plot.set_visible_cells([])
+    plot.mapper.Update()
+    assert plot.mapper.GetInput().GetNumberOfCells() == 0
+
+    plot.set_visible_cells(None)
+    assert plot.mapper.GetInput() is plot.polydata.vtk_polydata
+
+
+def test_binary_stl():
+    from vtkplotlib._stl import read_binary_stl, BINARY_DTYPE
+
+    triangles = np.zeros(5, BINARY_DTYPE)
+    triangles["vectors"] = np.random.random((5, 3, 3))
+    stl_path = TEST_DIR / "binary.stl"
+    # Binary STLs may also start with "solid".
+    with open(stl_path, "wb") as f:
+        f.write(b"solid".ljust(80) + np.uint32(5).tobytes())
+        f.write(triangles.tobytes())
+
+    for mmap in (True, False):
+        read = read_binary_stl(stl_path, mmap=mmap)
+        assert isinstance(read, np.memmap) is mmap
+        assert np.array_equal(read, triangles)
+        del read
+
+    plot = vpl.mesh_plot(stl_path, fig=None)
+    assert np.array_equal(plot.vectors, triangles["vectors"])
+
+    # Anything else isn't a binary STL.
+    with open(stl_path, "wb") as f:
+        f.write(b"solid".ljust(80) + np.uint32(5).tobytes())
+    assert read_binary_stl(stl_path) is None
+    with open(stl_path, "wb") as f:
+        f.write(b"solid".ljust(80) + np.uint32(0).tobytes())
+    assert read_binary_stl(stl_path).shape == (0,)
+    assert read_binary_stl(__file__) is None
+
+
+def test_ascii_stl():
+    from vtkplotlib._stl import read_ascii_stl
+
+    vectors = np.random.random((7, 3, 3)).astype(np.float32)
+    # The name mustn't be mistaken for a vertex.
+    lines = ["solid vertex_test"]
+    for triangle in vectors:
+        lines += ["  facet normal 0 0 1", "    outer loop"]
+        lines += [
+            "      vertex {!r} {!r} {!r}".format(*map(float, i))
+            for i in triangle
+        ]
+        lines += ["    endloop", "  endfacet"]
+    lines.append("endsolid vertex_test")
+    stl_path = TEST_DIR / "ascii.stl"
+    with open(stl_path, "wb") as f:
+        f.write("\r\n".join(lines).encode())
+
+    # Tiny chunks so that lines get split between them.
+    for chunk_size in (1 << 24, 100):
+        assert np.array_equal(read_ascii_stl(stl_path, chunk_size), vectors)
+
+    plot = vpl.mesh_plot(stl_path, fig=None)
+    assert np.array_equal(plot.vectors, vectors)
+
+    with open(stl_path, "wb") as f:
+        f.write("\n".join(lines[:-4] + ["endsolid"]).encode())
+    with pytest.raises(ValueError, match="multiple of 3"):
+        read_ascii_stl(stl_path)
+    with open(stl_path, "wb") as f:
+        f.write("\n".join(lines).replace("vertex 0", "vertex x").encode())
+    with pytest.raises(ValueError, match="invalid vertex"):
+        read_ascii_stl(stl_path)
+
+    # No vertices at all means it's something else.
+    with open(stl_path, "wb") as f:
+        f.write(b"solid vertex 1 2 3\nendsolid\n")
+    assert read_ascii_stl(stl_path) is None
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_mesh_plot_many(processes):
+    from vtkplotlib._stl import BINARY_DTYPE
+
+    paths = []
+    meshes = []
+    for i in range(6):
+        triangles = np.zeros(i + 1, BINARY_DTYPE)
+        triangles["vectors"] = np.random.random((i + 1, 3, 3))
+        path = TEST_DIR / "many-{}.stl".format(i)
+        with open(path, "wb") as f:
+            f.write(bytes(80) + np.uint32(i + 1).tobytes())
+            f.write(triangles.tobytes())
+        paths.append(path)
+        meshes.append(triangles["vectors"])
+
+    for ordered in (True, False):
+        calls = []
+        plots = vpl.mesh_plot_many(paths, workers=3, processes=processes,
+                                   ordered=ordered, fig=None, color="r",
+                                   progress=lambda *args: calls.append(args))
+        for (plot, mesh) in zip(plots, meshes):
+            assert np.array_equal(plot.vectors, mesh)
+            assert plot.color == (1, 0, 0)
+            assert plot.fig is None
+        assert [i[:2] for i in calls] == [(i, 6) for i in range(1, 7)]
+        assert sorted(i[2] for i in calls) == sorted(map(str, paths))
+        if ordered:
+            assert [i[2] for i in calls] == list(map(str, paths))
+
+    with pytest.raises(FileNotFoundError):
+        vpl.mesh_plot_many(paths + [TEST_DIR / "missing.stl"], fig=None,
+                           processes=processes)
+
+
+def test_mesh_cache():
+    from vtkplotlib.plots.MeshPlot import MeshCache
+    from vtkplotlib._stl import BINARY_DTYPE
+
+    triangles = np.zeros(10, BINARY_DTYPE)
+    triangles["vectors"] = np.random.random((10, 3, 3))
+    paths = [TEST_DIR / "cached-{}.stl".format(i) for i in range(3)]
+    for path in paths:
+        with open(path, "wb") as f:
+            f.write(bytes(80) + np.uint32(10).tobytes())
+            f.write(triangles.tobytes())
+    size = triangles["vectors"].nbytes
+
+    cache = vpl.mesh_plot.cache
+    assert isinstance(cache, MeshCache)
+    try:
+        # Disabled by default.
+        vpl.mesh_plot(paths[0], fig=None)
+        assert cache.cache_info() == (0, 0, 0, 0, 0)
+
+        cache.max_bytes = 2 * size
+        a = vpl.mesh_plot(paths[0], fig=None)
+        b = vpl.mesh_plot(paths[0], fig=None)
+        assert cache.cache_info() == (1, 1, 2 * size, size, 1)
+        # Both plots share the one copy of the vertices.
+        assert np.shares_memory(a.vectors, b.vectors)
+        assert np.array_equal(b.vectors, triangles["vectors"])
+
+        # Which mustn't be modified in-place.
+        with pytest.raises(ValueError):
+            a.vectors += 1
+        a.vectors = a.vectors + 1
+        a.polydata.update_points(0, [1, 2, 3])
+        assert np.array_equal(b.vectors, triangles["vectors"])
+        assert np.array_equal(cache.get(paths[0]), triangles["vectors"])
+
+        # The least recently used is evicted when it's full.
+        vpl.mesh_plot(paths[1], fig=None)
+        vpl.mesh_plot(paths[0], fig=None)
+        vpl.mesh_plot(paths[2], fig=None)
+        assert len(cache) == 2
+        assert cache.get(paths[1]) is None
+        assert cache.get(paths[0]) is not None
+
+        # Modifying a file invalidates it.
+        stat = os.stat(paths[0])
+        os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.get(paths[0]) is None
+
+        plots = vpl.mesh_plot_many(paths, fig=None, ordered=False)
+        for plot in plots:
+            assert np.array_equal(plot.vectors, triangles["vectors"])
+        assert len(cache) == 2
+
+        # mesh_plot_with_edge_scalars() uses the cache too.
+        cache.clear()
+        vpl.mesh_plot_with_edge_scalars(paths[1], np.zeros((10, 3)), fig=None)
+        vpl.mesh_plot_with_edge_scalars(paths[1], np.zeros((10, 3)), fig=None)
+        assert cache.cache_info()[:2] == (1, 1)
+
+        cache.max_bytes = size
+        assert len(cache) == 1 and cache.nbytes == size
+        cache.clear()
+        assert cache.cache_info() == (0, 0, size, 0, 0)
+    finally:
+        cache.clear()
+        cache.max_bytes = 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,9 +2,14 @@
 """
 """
 
+import os
+
 import numpy as np
 
 import pytest
+import vtkplotlib as vpl
+
+from tests._common import TEST_DIR
 
 pytestmark = pytest.mark.order(5)
 
@@ -51,7 +56,8 @@ def test(*spam):
 
 
 def test_packing():
-    from vtkplotlib.plots.polydata import pack_lengths, unpack_lengths
+    from vtkplotlib.plots.polydata import pack_lengths, unpack_lengths, \
+        join_line_ends
     randint = np.random.randint
 
     x = [randint(0, 10, i) for i in randint(0, 10, 10)]
@@ -62,6 +68,605 @@ def test_packing():
     assert len(x) == len(unpacked)
     assert all(map(np.array_equal, x, unpacked))
 
+    lengths = np.array([len(i) for i in x])
+    connectivity = np.concatenate(x)
+    ragged = vpl.RaggedCells(lengths, connectivity)
+    assert np.array_equal(pack_lengths(ragged), packed)
+
+    with pytest.raises(ValueError):
+        pack_lengths(vpl.RaggedCells(lengths + 1, connectivity))
+
+    joined = join_line_ends(ragged)
+    assert all(
+        map(np.array_equal, join_line_ends(np.array(x + [None], object)[:-1]),
+            unpack_lengths(pack_lengths(joined))))
+
+
+def test_ragged_cells_plots(monkeypatch):
+    vertices = np.random.random((9, 3))
+    cells = vpl.RaggedCells([3, 2, 4], np.arange(9))
+
+    # Only the given cells should be built - not a default line through every
+    # point beforehand.
+    assigned = []
+    lines_property = vpl.PolyData.lines
+
+    def spy(self, lines):
+        assigned.append(lines)
+        lines_property.fset(self, lines)
+
+    monkeypatch.setattr(vpl.PolyData, "lines", lines_property.setter(spy))
+    lines = vpl.plot(vertices, cells=cells, join_ends=True, fig=None)
+    assert len(assigned) == 1
+    monkeypatch.undo()
+    assert [len(i) for i in lines.polydata.lines] == [4, 3, 5]
+    assert lines.vertices.shape == (9, 3)
+
+    polygon = vpl.polygon(vertices, cells=cells, fig=None)
+    assert [len(i) for i in polygon.polydata.polygons] == [3, 2, 4]
+
+
+def test_points_view_cache():
+    import vtkplotlib as vpl
+
+    self = vpl.PolyData()
+    assert self.points is None
+
+    self.points = np.random.random((10, 3))
+    points = self.points
+    # Repeated reads should give the same view without accumulating anything.
+    assert self.points is points
+    assert np.shares_memory(self.points, self._points_view[1])
+
+    # Writes through the view must reach VTK.
+    points[0] = 5
+    assert self.vtk_polydata.GetPoint(0) == (5, 5, 5)
+
+    # Replacing the points must invalidate the cached view.
+    self.points = np.zeros((4, 3))
+    assert self.points is not points
+    assert self.points.shape == (4, 3)
+
+    # Nor should the cache keep replaced points alive.
+    import weakref
+    ref = weakref.ref(points)
+    del points
+    for replacement in (None, np.zeros((2, 3))):
+        self.points = replacement
+        assert self._points_view is None
+    assert ref() is None
+
+
+def test_csr_accessors():
+    self = vpl.PolyData()
+    self.points = np.random.random((9, 3))
+    cells = [np.arange(3), np.arange(3, 5), np.arange(5, 9)]
+
+    for name in ("lines", "polygons"):
+        assert len(getattr(self, name + "_offsets")) <= 1
+        assert len(getattr(self, name + "_connectivity")) == 0
+
+        setattr(self, name, cells)
+        offsets = getattr(self, name + "_offsets")
+        connectivity = getattr(self, name + "_connectivity")
+        assert offsets.tolist() == [0, 3, 5, 9]
+        assert connectivity.tolist() == list(range(9))
+
+        for (i, cell) in enumerate(cells):
+            assert np.array_equal(connectivity[offsets[i]:offsets[i + 1]], cell)
+
+    if vpl._get_vtk.VTK_VERSION_INFO >= (9,):
+        # Regular arrays of the right dtype should be passed to VTK uncopied.
+        assert self.cell_ids_dtype == np.int32
+        polygons = np.arange(9, dtype=self.cell_ids_dtype).reshape((3, 3))
+        self.polygons = polygons
+        assert np.shares_memory(self.polygons_connectivity, polygons)
+        assert self.polygons_offsets.tolist() == [0, 3, 6, 9]
+
+        # Other integer types should be narrowed.
+        self.polygons = polygons.astype(np.int64)
+        assert self.polygons_connectivity.dtype == np.int32
+        assert np.array_equal(self.polygons, polygons)
+
+        self.compact_cell_ids = False
+        self.polygons = polygons
+        assert self.polygons_connectivity.dtype == self.ID_ARRAY_DTYPE
+        assert np.array_equal(self.polygons, polygons)
+
+
+def test_concatenate():
+    parts = []
+    for i in range(4):
+        part = vpl.PolyData()
+        part.points = np.random.random((5, 3))
+        part.polygons = [[0, 1, 2], [1, 2, 3, 4]]
+        if i % 2:
+            part.lines = np.array([[0, 4]])
+            part.point_colors = np.arange(5.)
+        parts.append(part)
+
+    merged = vpl.PolyData.concatenate(parts)
+    assert np.array_equal(merged.points,
+                          np.concatenate([i.points for i in parts]))
+    expected = [[k + 5 * i for k in j] for i in range(4)
+                for j in ([0, 1, 2], [1, 2, 3, 4])]
+    assert [i.tolist() for i in merged.polygons] == expected
+    assert merged.lines.tolist() == [[5, 9], [15, 19]]
+    assert merged.part_ids.tolist() == [1, 3, 0, 0, 1, 1, 2, 2, 3, 3]
+    assert merged.point_colors.tolist() == [0] * 5 + list(range(5)) + [0] * 5 \
+        + list(range(5))
+
+    added = parts[0] + parts[1]
+    assert np.array_equal(added.points, merged.points[:10])
+    assert added.lines.tolist() == [[5, 9]]
+
+    assert vpl.PolyData.concatenate([]).points is None
+
+    # uint8 RGB colors stay uint8 and float RGB colors are converted to match.
+    parts[0].point_colors = np.full((5, 3), 255, np.uint8)
+    parts[1].point_colors = np.ones((5, 3))
+    merged = vpl.PolyData.concatenate(parts[:3])
+    assert merged.point_colors.dtype == np.uint8
+    assert merged.point_colors.tolist() == [[255] * 3] * 10 + [[0] * 3] * 5
+
+
+def test_copies():
+    self = vpl.PolyData()
+    self.points = np.random.random((6, 3))
+    self.polygons = np.arange(6).reshape((2, 3))
+    self.point_colors = np.arange(6.)
+    self.cmap = "Blues"
+
+    copy = self.copy()
+    assert not np.shares_memory(copy.points, self.points)
+    assert np.array_equal(copy.points, self.points)
+    assert np.array_equal(copy.polygons, self.polygons)
+    assert np.array_equal(copy.point_colors, self.point_colors)
+    assert copy.color_source == self.color_source
+    assert copy.cmap is self.cmap
+    copy.points += 1
+    assert not np.array_equal(copy.points, self.points)
+
+    shallow = self.shallow_copy()
+    for polydata in (self, shallow):
+        for attr in ("points", "point_colors", "polygons_connectivity"):
+            assert np.shares_memory(getattr(self, attr), getattr(shallow, attr))
+            with pytest.raises(ValueError):
+                getattr(polydata, attr)[0] = 0
+
+    # Writing to one side should leave the other untouched.
+    old_points = self.points
+    shallow.points = shallow.points + 10
+    assert self.points is old_points
+    assert np.array_equal(shallow.points, self.points + 10)
+    shallow.points[0] = 0
+    shallow.point_colors = None
+    assert self.point_colors is not None
+
+    # Replaced arrays and deleted copies mustn't be kept alive by the record
+    # of what's shared.
+    del polydata
+    for i in range(20):
+        shallow = self.shallow_copy()
+        shallow.points = shallow.points + i
+    self._share()
+    assert len(self._shared) <= len(list(self._buffers()))
+    assert len(shallow._shared) <= len(list(shallow._buffers()))
+
+    # Once the copy is gone, the arrays are no longer shared.
+    shallow = self.shallow_copy()
+    del shallow
+    self.points[0] = 0
+    self.point_colors += 1
+    self.polygons_connectivity[0] = 0
+
+    # Per-instance settings are carried over.
+    self = vpl.PolyData(points_dtype=np.float32)
+    self.quantize_colors = True
+    self._auto_scalar_range = True
+    for copy in (self.copy(), self.shallow_copy()):
+        copy.points = np.random.random((3, 3))
+        assert copy.points.dtype == np.float32
+        assert copy.quantize_colors is True
+        assert copy._auto_scalar_range is True
+    assert "points_dtype" not in vars(vpl.PolyData().copy())
+
+
+def test_read_only_points():
+    self = vpl.PolyData()
+    points = np.random.random((6, 3))
+    points.flags.writeable = False
+    self.points = points
+    assert np.shares_memory(self.points, points)
+    with pytest.raises(ValueError):
+        self.points[0] = 0
+    self.update_points(0, [1, 2, 3])
+    assert not np.array_equal(points[0], [1, 2, 3])
+    assert np.array_equal(self.points[0], [1, 2, 3])
+
+    for i in range(20):
+        self.points = points
+    assert len(self._shared) == 1
+    self.points = points.copy()
+    assert self._shared == []
+
+    # Likewise for cells which VTK can use without copying.
+    ids = np.arange(6, dtype=self.cell_ids_dtype)
+    polygons = np.frombuffer(ids.tobytes(), ids.dtype).reshape((2, 3))
+    self.polygons = polygons
+    assert np.shares_memory(self.polygons_connectivity, polygons)
+    assert not self.polygons_connectivity.flags.writeable
+    self.polygons = polygons.copy()
+    assert self.polygons_connectivity.flags.writeable
+
+
+def test_append():
+    self = vpl.PolyData()
+    points = np.random.random((100, 3))
+    colors = np.random.random((100, 3))
+
+    for i in range(10):
+        self.append_points(points[i * 10:(i + 1) * 10],
+                           colors[i * 10:(i + 1) * 10])
+        self.append_lines(np.arange(i * 10, i * 10 + 10).reshape((2, 5)))
+        self.append_polygons(vpl.RaggedCells([3, 4], np.arange(7) + i * 10))
+
+    assert np.array_equal(self.points, points)
+    assert np.array_equal(self.point_colors, colors)
+    assert np.array_equal(self.lines, np.arange(100).reshape((20, 5)))
+    assert self.polygons_offsets.tolist() == list(np.cumsum([0] + [3, 4] * 10))
+    connectivity = np.arange(7) + np.arange(0, 100, 10)[:, np.newaxis]
+    assert np.array_equal(self.polygons_connectivity, connectivity.ravel())
+
+    # Appending should reuse the buffers until they are full.
+    buffer = self._growables["points"][0].buffer
+    assert len(buffer) > len(points)
+    self.append_points(points[:1], colors[:1])
+    assert self._growables["points"][0].buffer is buffer
+    assert np.shares_memory(self.points, buffer)
+
+    # Reassigning should still be respected.
+    self.points = points[:3]
+    self.point_colors = None
+    self.append_points(points[3:5])
+    assert np.array_equal(self.points, points[:5])
+
+    with pytest.raises(ValueError):
+        self.append_points(points, colors)
+
+
+def test_update():
+    self = vpl.PolyData()
+    self.points = np.zeros((10, 3))
+    self.polygons = np.arange(9).reshape((3, 3))
+    self.point_colors = np.zeros(10)
+    self.polygon_colors = np.zeros((3, 3), np.uint8)
+
+    data = self.vtk_polydata.GetPoints().GetData()
+    mtime = data.GetMTime()
+    polygons_mtime = self.vtk_polydata.GetPolys().GetMTime()
+    self.update_points(slice(2, 4), [1, 2, 3])
+    assert self.points[2:4].tolist() == [[1, 2, 3]] * 2
+    assert self.points[4:].sum() == 0
+    assert self.vtk_polydata.GetPoints().GetData() is data
+    assert data.GetMTime() > mtime
+    assert self.vtk_polydata.GetPolys().GetMTime() == polygons_mtime
+
+    self.update_point_colors([0, -1], 5)
+    assert self.point_colors.tolist() == [5] + [0] * 8 + [5]
+    self.update_polygon_colors(1, [255, 0, 0])
+    assert self.polygon_colors.tolist() == [[0, 0, 0], [255, 0, 0], [0, 0, 0]]
+
+    # Shared data should be copied first.
+    copy = self.shallow_copy()
+    copy.update_points(0, 9)
+    copy.update_point_colors(0, 9)
+    assert self.points[0].tolist() == [0, 0, 0]
+    assert self.point_colors[0] == 5
+    assert copy.points[0].tolist() == [9, 9, 9]
+    assert copy.point_colors[0] == 9
+
+
+def test_set_points_soa():
+    x, y = np.meshgrid(np.arange(4.), np.arange(3.))
+    z = x * y
+
+    self = vpl.PolyData()
+    self.set_points_soa(x, y, z)
+    points = vpl.zip_axes(x, y, z).reshape((-1, 3))
+    assert np.array_equal(self.points, points)
+    assert not self.points.flags.writeable
+    assert self.vtk_polydata.GetPoints().GetPoint(5) == tuple(points[5])
+
+    if vpl.vtk.VTK_MAJOR_VERSION < 9:
+        return
+
+    # z is contiguous so it should be shared - not copied.
+    z[1, 1] = 100
+    assert self.vtk_polydata.GetPoints().GetPoint(5)[2] == 100
+
+    self.update_points(slice(2), 7)
+    assert self.points[:2].tolist() == [[7, 7, 7]] * 2
+    assert z.flat[0] == 7
+
+    copy = self.shallow_copy()
+    copy.update_points(0, [1, 2, 3])
+    assert copy.points[0].tolist() == [1, 2, 3]
+    assert self.points[0].tolist() == [7, 7, 7]
+
+    copy.append_points(np.ones((2, 3)))
+    assert copy.points.shape == (14, 3)
+
+    plot = vpl.surface(x, y, z, zero_copy=True, fig=None)
+    assert np.array_equal(plot.polydata.points,
+                          vpl.surface(x, y, z, fig=None).polydata.points)
+    assert plot.polydata.polygons.shape == (6, 4)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(mmap):
+    self = vpl.PolyData()
+    self.points = np.random.random((10, 3))
+    self.lines = vpl.RaggedCells([2, 3], np.arange(5))
+    self.polygons = np.arange(9).reshape((3, 3))
+    self.polygon_colors = np.random.random(3)
+    self.scalar_range = 0, 2
+
+    path = TEST_DIR / "polydata.vplpoly"
+    self.save(path)
+    loaded = vpl.PolyData.load(path, mmap=mmap)
+
+    for name in self._saved_arrays:
+        assert np.array_equal(getattr(self, name), getattr(loaded, name))
+    assert loaded.point_colors is None
+    assert loaded.color_source == "polygon_colors"
+    assert loaded.scalar_range == (0, 2)
+    assert isinstance(loaded._vertices.base, np.memmap) is mmap
+
+    # Modifications must never reach the file.
+    loaded.update_points(0, 100)
+    assert vpl.PolyData.load(path).points[0].tolist() == \
+        self.points[0].tolist()
+
+    with pytest.raises(ValueError):
+        vpl.PolyData.load(__file__)
+
+
+def test_shared_memory(monkeypatch):
+    pytest.importorskip("multiprocessing.shared_memory")
+    self = vpl.PolyData()
+    self.points = np.random.random((10, 3))
+    self.polygons = np.arange(9).reshape((3, 3))
+    self.point_colors = np.random.random((10, 3))
+
+    block = self.to_shared_memory()
+    try:
+        shared = vpl.PolyData.from_shared_memory(block.name)
+        for name in self._saved_arrays:
+            assert np.array_equal(getattr(self, name), getattr(shared, name))
+        assert shared.shared_memory_version == 2
+        assert not shared.shared_memory_stale
+        assert self.shared_memory_version is None
+
+        # Rewrite the block in-place.
+        self.update_points(0, 10)
+        assert self.to_shared_memory(block.name).name == block.name
+        assert shared.shared_memory_stale
+        assert shared.shared_memory_version == 4
+        shared = vpl.PolyData.from_shared_memory(block.name)
+        assert shared.points[0].tolist() == [10, 10, 10]
+
+        # A write made whilst reading makes the reader start again.
+        from_layout = vpl.PolyData._from_shared_layout
+
+        def interrupted(cls, block_, header_size):
+            monkeypatch.undo()
+            self.update_points(0, 20)
+            self.to_shared_memory(block.name)
+            return from_layout(block_, header_size)
+
+        monkeypatch.setattr(vpl.PolyData, "_from_shared_layout",
+                            classmethod(interrupted))
+        shared = vpl.PolyData.from_shared_memory(block.name)
+        assert shared.shared_memory_version == 6
+        assert shared.points[0].tolist() == [20, 20, 20]
+
+        # The new data must be laid out exactly like the old.
+        self.points = np.random.random((10000, 3))
+        with pytest.raises(ValueError):
+            self.to_shared_memory(block.name)
+        self.points = self.points[:10]
+        self.polygons = np.arange(6).reshape((2, 3))
+        with pytest.raises(ValueError):
+            self.to_shared_memory(block.name)
+        assert shared.polygons_offsets.tolist() == [0, 3, 6, 9]
+
+        # Reloading mustn't leak file descriptors.
+        if os.path.isdir("/proc/self/fd"):
+            fds = len(os.listdir("/proc/self/fd"))
+            for i in range(20):
+                vpl.PolyData.from_shared_memory(block.name)
+            assert len(os.listdir("/proc/self/fd")) == fds
+    finally:
+        block.unlink()
+
+
+def test_weld():
+    self = vpl.PolyData()
+    self.points = [[0, 0, 0], [1, 0, 0], [0, 0, 0], [2, 0, 0], [1, 0, 0]]
+    self.lines = [[0, 1], [2, 3, 4]]
+    self.polygons = [[4, 3, 2]]
+    self.point_colors = np.array([10, 11, 12, 13, 14])
+
+    self.weld()
+    assert self.points.tolist() == [[0, 0, 0], [1, 0, 0], [2, 0, 0]]
+    assert [i.tolist() for i in self.lines] == [[0, 1], [0, 2, 1]]
+    assert self.polygons.tolist() == [[1, 2, 0]]
+    assert self.point_colors.tolist() == [10, 11, 13]
+    assert self.color_source == "point_colors"
+
+    empty = vpl.PolyData()
+    empty.weld()
+    assert empty.points is None
+
+
+def test_normals():
+    self = vpl.PolyData()
+    self.points = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 1], [5, 5, 5]]
+    self.polygons = [[0, 1, 2], [0, 2, 3, 3]]
+
+    normal = np.float32(3**-.5)
+    assert self.polygon_normals.tolist() == [[0, 0, 1],
+                                             [normal, -normal, normal]]
+    assert self.point_normals[1].tolist() == [0, 0, 1]
+    assert np.allclose(self.point_normals[3], self.polygon_normals[1])
+    assert self.point_normals[4].tolist() == [0, 0, 0]
+    assert not self.point_normals.flags.writeable
+
+    # Cached until the geometry changes.
+    normals = self.point_normals
+    assert self.point_normals is normals
+    self.point_colors = np.arange(5)
+    assert self.point_normals is normals
+    self.update_points(3, [0, 1, 0])
+    assert self.polygon_normals[1].tolist() == [0, 0, 1]
+    self.polygons = [[2, 1, 0]]
+    assert self.polygon_normals.tolist() == [[0, 0, -1]]
+
+    # Empty polygons, including trailing ones, mustn't disturb the others.
+    from vtkplotlib.plots.polydata import _polygon_normals
+    points = [[1, 0, 0], [2, 1, 0], [0, 2, 0]]
+    for offsets in ([0, 3], [0, 3, 3], [0, 0, 3, 3, 3]):
+        normals = _polygon_normals(points, np.array(offsets), np.arange(3))
+        assert normals[np.diff(offsets) > 0].tolist() == [[0, 0, 3]]
+        assert not normals[np.diff(offsets) == 0].any()
+
+    normals_array = self.vtk_polydata.GetPointData().GetNormals
+    assert normals_array() is None
+    self.smooth = True
+    assert normals_array().GetTuple3(1) == tuple(self.point_normals[1])
+    self.update_points(2, [1, 1, -1])
+    assert normals_array().GetTuple3(0) == tuple(self.point_normals[0])
+    self.smooth = False
+    assert normals_array() is None
+
+    plot = vpl.mesh_plot(vpl.data.get_rabbit_stl(), weld=True, smooth=True,
+                         fig=None)
+    assert plot.smooth
+    assert plot.polydata.vtk_polydata.GetPointData().GetNormals() is not None
+
+
+def test_to_strips():
+    # A 2x2 grid of squares split into 8 triangles.
+    self = vpl.PolyData()
+    self.points = vpl.zip_axes(*np.meshgrid(np.arange(3), np.arange(3), 0))\
+        .reshape((-1, 3))
+    ids = np.arange(9).reshape((3, 3))
+    corners = ids[:-1, :-1], ids[1:, :-1], ids[1:, 1:], ids[:-1, 1:]
+    self.polygons = np.concatenate([
+        np.stack([corners[0], corners[1], corners[2]], -1).reshape((-1, 3)),
+        np.stack([corners[0], corners[2], corners[3]], -1).reshape((-1, 3)),
+    ])
+
+    strips = self.to_strips()
+    assert strips.vtk_polydata.GetNumberOfPolys() == 0
+    assert 0 < strips.vtk_polydata.GetNumberOfStrips() < 8
+    assert np.array_equal(strips.points, self.points)
+    assert self.to_strips() is strips
+
+    self.update_points(0, [0, 0, 1])
+    assert self.to_strips() is not strips
+    assert self.to_strips().points[0].tolist() == [0, 0, 1]
+
+
+def test_extract_cells():
+    self = vpl.PolyData()
+    self.points = np.random.random((6, 3))
+    self.lines = [[0, 1], [1, 2, 3]]
+    self.polygons = [[0, 1, 2], [3, 4, 5], [1, 2, 3, 4]]
+    self.polygon_colors = np.arange(5.)
+    self.point_colors = np.arange(6)
+
+    subset = self.extract_cells(np.array([False, True, False, True, True]))
+    assert [i.tolist() for i in subset.lines] == [[1, 2, 3]]
+    assert [i.tolist() for i in subset.polygons] == [[3, 4, 5], [1, 2, 3, 4]]
+    assert subset.polygon_colors.tolist() == [1, 3, 4]
+    assert subset.color_source == self.color_source
+
+    # The points are shared, not copied.
+    assert subset.vtk_polydata.GetPoints() is self.vtk_polydata.GetPoints()
+    assert np.shares_memory(subset.point_colors, self.point_colors)
+    self.update_points(5, [1, 2, 3])
+    assert subset.points[5].tolist() == [1, 2, 3]
+
+    # Ids rather than a mask. Lines always come before polygons.
+    subset = self.extract_cells([-1, 0])
+    assert [i.tolist() for i in subset.lines] == [[0, 1]]
+    assert [i.tolist() for i in subset.polygons] == [[1, 2, 3, 4]]
+    assert subset.polygon_colors.tolist() == [0, 4]
+
+    assert self.extract_cells(np.zeros(5, bool)).vtk_polydata \
+        .GetNumberOfCells() == 0
+    assert self.extract_cells([]).vtk_polydata.GetNumberOfCells() == 0
+    with pytest.raises(ValueError):
+        self.extract_cells(np.ones(4, bool))
+
+
+def test_nbytes():
+    self = vpl.PolyData()
+    assert self.nbytes == 0
+    self.points = np.zeros((100, 3))
+    assert self.nbytes == 2400
+
+    # The spare capacity of append buffers counts too.
+    self.append_points(np.zeros((1, 3)))
+    assert self.nbytes == 200 * 24
+
+    self.polygons = np.arange(99).reshape((33, 3))
+    if vpl.vtk.VTK_MAJOR_VERSION >= 9:
+        cells_size = (99 + 34) * np.dtype(self.cell_ids_dtype).itemsize
+        assert self.nbytes == 200 * 24 + cells_size
+
+        self.point_colors = np.zeros(101, np.float32)
+        assert self.nbytes == 200 * 24 + cells_size + 101 * 4
+
+
+def test_scalar_range():
+    self = vpl.PolyData()
+    self.points = np.zeros((5, 3))
+    self.point_colors = np.array([1., np.nan, 3, 4, 5])
+    self.scalar_range = ...
+    assert self.scalar_range == (1, 5)
+
+    # Explicit ranges are left alone by updates.
+    self.scalar_range = 0, 10
+    self.update_point_colors(0, -1)
+    assert self.scalar_range == (0, 10)
+
+    self.scalar_range = ...
+    assert self.scalar_range == (-1, 5)
+    # Widening the range can be done without a full recalculation.
+    self.update_point_colors(2, 20)
+    assert self.scalar_range == (-1, 20)
+    assert self._colors_ranges["point_colors"][2] == (-1, 20)
+    # Overwriting the max can't.
+    self.update_point_colors(2, 3)
+    assert self.scalar_range == (-1, 5)
+
+    self.point_colors = np.full(5, np.nan)
+    self.scalar_range = ...
+    assert self.scalar_range == (-1, 5)
+
+
+def test_plot_scalar_range():
+    plot = vpl.plot(np.zeros((3, 3)), color=np.arange(3.), fig=None)
+    assert plot.scalar_range == (0, 2)
+    plot.color = np.arange(5., 8.)
+    assert plot.scalar_range == (5, 7)
+    plot.scalar_range = 0, 1
+    plot.color = np.arange(3.)
+    assert plot.scalar_range == (0, 1)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -18,7 +18,7 @@ from .figures import (
 
 from .plots.Arrow import arrow, quiver
 from .plots.Lines import Lines as plot
-from .plots.MeshPlot import MeshPlot as mesh_plot, mesh_plot_with_edge_scalars, NUMPY_STL_AVAILABLE
+from .plots.MeshPlot import MeshPlot as mesh_plot, mesh_plot_with_edge_scalars, mesh_plot_many, NUMPY_STL_AVAILABLE
 from .plots.Polygon import Polygon as polygon
 from .plots.ScalarBar import ScalarBar as scalar_bar
 from .plots.Scatter import scatter
@@ -28,7 +28,7 @@ from .plots.Text3D import Text3D as text3d, annotate
 from .plots.Legend import Legend as legend
 
 from .plots import BasePlot
-from .plots.polydata import PolyData
+from .plots.polydata import PolyData, RaggedCells
 
 from . import data, image_io, interactive, colors, geometry, nuts_and_bolts
 
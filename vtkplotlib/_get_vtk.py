@@ -6,6 +6,7 @@ import os
 try:
     from vtkplotlib import _vtk as vtk
     from vtkmodules.util import numpy_support
+    from vtkmodules.util.vtkAlgorithm import VTKPythonAlgorithmBase
     from vtkmodules import vtkRenderingGL2PSOpenGL2
 
 except ImportError:
@@ -13,6 +14,7 @@ except ImportError:
         raise
     import vtk
     from vtk.util import numpy_support
+    from vtk.util.vtkAlgorithm import VTKPythonAlgorithmBase
 
 if vtk.VTK_MAJOR_VERSION >= 9:
     from vtkmodules import (
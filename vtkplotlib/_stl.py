@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Read STL files using only numpy so that neither numpy-stl nor VTK's
+patchy vtkSTLReader is needed.
+
+A binary STL is an 80 byte header, a little-endian uint32 triangle count and
+then a 50 byte record per triangle. The records are mapped directly from the
+file using a structured dtype so opening even a huge file reads nothing more
+than its first 84 bytes.
+
+ASCII STLs are parsed in fixed size chunks. Only the ``vertex`` lines matter.
+Each chunk's vertex lines are found with one regex search then converted to
+floats in one go by numpy.
+"""
+
+import os
+import re
+
+import numpy as np
+
+BINARY_HEADER_SIZE = 84
+
+BINARY_DTYPE = np.dtype([
+    ("normals", "<f4", (3,)),
+    ("vectors", "<f4", (3, 3)),
+    ("attributes", "<u2"),
+])
+
+
+def binary_triangle_count(path):
+    """Get the number of triangles in a binary STL file or `None` if **path**
+    isn't a binary STL.
+
+    Some binary STLs start with ``solid`` like an ASCII STL so the only
+    reliable test is that the file is the right size for its triangle count.
+    """
+    size = os.path.getsize(path)
+    if size < BINARY_HEADER_SIZE:
+        return None
+    with open(path, "rb") as f:
+        f.seek(BINARY_HEADER_SIZE - 4)
+        count = int(np.frombuffer(f.read(4), "<u4")[0])
+    if size != BINARY_HEADER_SIZE + count * BINARY_DTYPE.itemsize:
+        return None
+    return count
+
+
+def read_binary_stl(path, mmap=True):
+    """Read a binary STL file.
+
+    :param path: The filename to read.
+    :type path: str or os.PathLike
+
+    :param mmap: Memory-map the file rather than reading it, defaults to True.
+    :type mmap: bool
+
+    :return: The triangles as a structured array with fields ``normals``, ``vectors`` and ``attributes`` or `None` if **path** isn't a binary STL.
+    :rtype: numpy.ndarray
+
+    With **mmap**, the result is a read-only `numpy.memmap` and pages of the
+    file are only read when they are used.
+
+    """
+    count = binary_triangle_count(path)
+    if count is None:
+        return None
+    if count == 0:
+        return np.empty(0, BINARY_DTYPE)
+    if mmap:
+        return np.memmap(path, BINARY_DTYPE, "r", BINARY_HEADER_SIZE, (count,))
+    return np.fromfile(str(path), BINARY_DTYPE, count,
+                       offset=BINARY_HEADER_SIZE)
+
+
+_VERTEX_LINE = re.compile(rb"^[ \t]*vertex[ \t]+([^\r\n]*)",
+                          re.IGNORECASE | re.MULTILINE)
+
+
+def is_ascii_stl(path):
+    """Test if **path** looks like an ASCII STL. Check `binary_triangle_count`
+    first as binary STLs may also pass this test."""
+    with open(path, "rb") as f:
+        return f.read(1024).lstrip().lower().startswith(b"solid")
+
+
+def read_ascii_stl(path, chunk_size=1 << 24):
+    """Read an ASCII STL file.
+
+    :param path: The filename to read.
+    :type path: str or os.PathLike
+
+    :param chunk_size: How many bytes of the file to parse at a time, defaults to 16MiB.
+    :type chunk_size: int
+
+    :return: The triangles' corners as an ``(n, 3, 3)`` float32 array or `None` if the file contains no ``vertex`` lines.
+    :rtype: numpy.ndarray
+
+    The file is read and parsed a chunk at a time. Each chunk's values are
+    written into one buffer which grows as needed so the output isn't held
+    twice. The facet normals are ignored.
+
+    """
+    vectors = np.empty(0, np.float32)
+    size = 0
+    remainder = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk_size)
+            text = remainder + block
+            if block:
+                # Only parse whole lines. Save the last partial line for the
+                # next chunk.
+                cut = text.rfind(b"\n") + 1
+                text, remainder = text[:cut], text[cut:]
+
+            lines = _VERTEX_LINE.findall(text)
+            if lines:
+                try:
+                    values = np.fromstring(b" ".join(lines), np.float32,
+                                           sep=" ")
+                except ValueError:
+                    values = None
+                if values is None or len(values) != 3 * len(lines):
+                    raise ValueError("{!r} contains an invalid vertex "
+                                     "line.".format(str(path)))
+                if size + len(values) > len(vectors):
+                    # Over-allocate so that resizing is rare.
+                    capacity = max(size + len(values), len(vectors) * 3 // 2)
+                    vectors.resize(capacity, refcheck=False)
+                vectors[size:size + len(values)] = values
+                size += len(values)
+                del values
+
+            if not block:
+                break
+
+    if not size:
+        return None
+    if size % 9:
+        raise ValueError("{!r} has a number of vertices which isn't a "
+                         "multiple of 3.".format(str(path)))
+    vectors.resize(size, refcheck=False)
+    return vectors.reshape((-1, 3, 3))
@@ -11,6 +11,12 @@ from vtkmodules.vtkCommonCore import (
     VTK_COLOR_MODE_DIRECT_SCALARS, vtkLookupTable, vtkObject, VTK_MINOR_VERSION,
     VTK_BUILD_VERSION)
 
+try:
+    from vtkmodules.vtkCommonCore import vtkSOADataArrayTemplate
+except ImportError:
+    # Not wrapped by all VTK builds. PolyData.set_points_soa() checks for it.
+    pass
+
 from vtkmodules.vtkCommonDataModel import (vtkImageData, vtkCellArray,
                                            vtkPolyData)
 
@@ -18,6 +24,8 @@ from vtkmodules.vtkCommonMath import (vtkMatrix4x4)
 
 from vtkmodules.vtkCommonTransforms import (vtkTransform)
 
+from vtkmodules.vtkFiltersCore import (vtkStripper)
+
 from vtkmodules.vtkFiltersGeneral import (vtkCursor3D)
 
 from vtkmodules.vtkFiltersSources import (vtkCubeSource, vtkSphereSource,
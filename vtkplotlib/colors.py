@@ -151,6 +151,11 @@ normalise
 
 .. autofunction:: vtkplotlib.colors.normalise
 
+quantize
+^^^^^^^^
+
+.. autofunction:: vtkplotlib.colors.quantize
+
 """
 
 import numpy as np
@@ -308,6 +313,40 @@ def normalise(colors, axis=None):
     return colors
 
 
+def quantize(colors):
+    """Convert RGB(A) values between 0 and 1 into compact ``uint8`` values
+    between 0 and 255.
+
+    :param colors: Array of colors.
+    :type colors: numpy.ndarray
+
+    :return: Quantized colors with the same shape as **colors**.
+    :rtype: numpy.ndarray
+
+    VTK renders ``uint8`` RGB(A) colors natively so this uses an eighth of the
+    memory of ``float64`` colors for no visible difference. Values outside of
+    0 to 1 are clipped. Integer arrays are assumed to be already quantized
+    and are returned as ``uint8``.
+
+    .. code-block:: python
+
+        import vtkplotlib as vpl
+        import numpy as np
+
+        points = np.random.uniform(-30, 30, (300, 3))
+        colors = vpl.colors.quantize(vpl.colors.normalise(points))
+        vpl.scatter(points, color=colors)
+        vpl.show()
+
+    """
+    colors = np.asarray(colors)
+    if colors.dtype.kind in "ui":
+        return colors.astype(np.uint8, copy=False)
+    out = np.multiply(colors, 255)
+    np.clip(out, 0, 255, out=out)
+    return np.rint(out, out=out).astype(np.uint8)
+
+
 class TextureMap(object):
     """Use a 2D image as a color lookup table.
 
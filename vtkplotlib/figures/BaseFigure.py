@@ -205,6 +205,75 @@ class BaseFigure(object):
 
     ############  some other bits  #############################################
 
+    def memory_report(self):
+        """Break down the memory used by each plot in this figure and by the
+        cached colormaps in ``vtkplotlib.colors.converted_cmaps``.
+
+        :return: A table with a row per array.
+        :rtype: str
+
+        Plots are listed largest first. Memory which has already been listed
+        (e.g. points shared by a `vtkplotlib.PolyData.shallow_copy()` or a
+        colormap used by several plots) is marked as shared and isn't counted
+        again towards the total. Rows for numpy arrays starting with an
+        underscore (such as ``_vertices``) only show memory not already
+        accounted for. That is usually stale copies or the spare capacity
+        reserved by `vtkplotlib.PolyData.append_points()`.
+
+        .. code-block:: python
+
+            import vtkplotlib as vpl
+
+            vpl.mesh_plot(vpl.data.get_rabbit_stl())
+            print(vpl.gcf().memory_report())
+
+        """
+        from vtkplotlib.plots.polydata import _ByteCounter
+        from vtkplotlib.colors import converted_cmaps
+        from vtkplotlib._get_vtk import vtk_to_numpy
+
+        owners = []
+        for plot in sorted(self.plots, key=lambda plot: -plot.nbytes):
+            name = "{} {}".format(
+                type(plot).__name__, plot.label or hex(id(plot)))
+            polydata = getattr(plot, "polydata", None)
+            owners.append((name, polydata._arrays() if polydata else ()))
+        owners.append(("colors.converted_cmaps",
+                       ((repr(name), vtk_to_numpy(table.GetTable()))
+                        for (name, table) in converted_cmaps.items())))
+
+        counter = _ByteCounter()
+        rows = []
+        total = 0
+        # Hold onto every array until the end. Otherwise temporary arrays
+        # could be freed and their memory reused, looking like sharing.
+        arrays_seen = []
+        for (owner, arrays) in owners:
+            for (name, array) in arrays:
+                arrays_seen.append(array)
+                new, shared_with = counter.add(array, (owner, name))
+                total += new
+                if name.startswith("_"):
+                    if new:
+                        rows.append((owner, name, new, ""))
+                elif shared_with is not None:
+                    rows.append((owner, name, array.nbytes,
+                                 "shared with {} {}".format(*shared_with)))
+                else:
+                    rows.append((owner, name, array.nbytes, ""))
+        rows.append(("Total", "", total, ""))
+
+        header = ("Plot", "Array", "Bytes", "")
+        widths = [
+            max(len(str(row[i])) for row in rows + [header]) for i in range(3)
+        ]
+        lines = []
+        for row in [header] + rows:
+            lines.append("{:<{}}  {:<{}}  {:>{}}  {}".format(
+                row[0], widths[0], row[1], widths[1], row[2], widths[2],
+                row[3]).rstrip())
+        return "\n".join(lines)
+
     @classmethod
     def _abc_assert_no_abstract_methods(cls):
         """Ideally this class would be an `abc.ABC` but in order for multiple
@@ -88,6 +88,15 @@ class BasePlot(object):
     def visible(self, x):
         self.actor.SetVisibility(x)
 
+    @property
+    def nbytes(self):
+        """The memory in bytes used by this plot's geometry, colors and
+        lookup table. See `vtkplotlib.PolyData.nbytes`."""
+        polydata = getattr(self, "polydata", None)
+        if polydata is None:
+            return 0
+        return polydata.nbytes
+
     def quick_show(self):
         from vtkplotlib import gcf, scf, figure
         old_gcf = gcf(False)
@@ -149,7 +158,7 @@ class ConstructedPlot(BasePlot):
     @scalar_range.setter
     def scalar_range(self, range):
         self.polydata.scalar_range = range
-        if range is not None or range is not Ellipsis:
+        if range is not None and range is not Ellipsis:
             self._freeze_scalar_range = True
 
     cmap = PolyData.cmap
@@ -3,7 +3,7 @@
 import numpy as np
 
 from vtkplotlib.plots.BasePlot import ConstructedPlot
-from vtkplotlib.plots.polydata import join_line_ends
+from vtkplotlib.plots.polydata import join_line_ends, RaggedCells
 
 
 class Lines(ConstructedPlot):
@@ -32,6 +32,12 @@ class Lines(ConstructedPlot):
     :param label: Give the plot a label to use in a `legend`.
     :type label: str
 
+    :param cells: Point indices for each line if **vertices** is a flat ``(n, 3)`` array of points shared by several lines, defaults to one line through each row of **vertices**.
+    :type cells: numpy.ndarray or `vtkplotlib.RaggedCells`
+
+    :param points_dtype: Convert the vertices to this dtype (e.g. `numpy.float32` to halve memory usage) when they are assigned, defaults to `vtkplotlib.PolyData.points_dtype`.
+    :type points_dtype: numpy.dtype
+
     :return: A lines object. Always a single object - even when plotting multiple lines.
     :rtype: `vtkplotlib.plot`
 
@@ -81,20 +87,50 @@ class Lines(ConstructedPlot):
 
         vpl.show()
 
+    To plot many lines of differing lengths in one go, use a flat array of
+    **vertices** and give the number of points in each line using
+    **cells**:
+
+    .. code-block:: python
+
+        import vtkplotlib as vpl
+        import numpy as np
+
+        vertices = np.random.random((9, 3))
+
+        # Three lines of 3, 2 and 4 points respectively.
+        cells = vpl.RaggedCells(lengths=[3, 2, 4], connectivity=np.arange(9))
+
+        vpl.plot(vertices, cells=cells)
+        vpl.show()
+
     """
 
     def __init__(self, vertices, color=None, opacity=None, line_width=1.0,
-                 join_ends=False, cmap=None, fig="gcf", label=None):
+                 join_ends=False, cmap=None, fig="gcf", label=None, cells=None,
+                 points_dtype=None):
         super().__init__(fig)
         self.connect()
+        if points_dtype is not None:
+            self.polydata.points_dtype = points_dtype
 
         self.shape = ()
         self.join_ends = join_ends
-        self.vertices = vertices
+        if cells is None:
+            self.vertices = vertices
+        else:
+            # Skip the `vertices` setter which would make one line through
+            # every point only for it to be immediately replaced.
+            vertices = np.asarray(vertices)
+            self.polydata.points = vertices.reshape((-1, 3))
+            self.shape = vertices.shape
+            if self.join_ends:
+                cells = join_line_ends(cells)
+            self.polydata.lines = cells
         # self.opacity = opacity
         # self.color = color
         # self.line_width = line_width
-        del vertices
+        del vertices, cells, points_dtype
         self.__setstate__(locals())
 
     @property
@@ -118,7 +154,7 @@ class Lines(ConstructedPlot):
             return
 
         self.shape = vertices.shape
-        args = np.arange(np.prod(self.shape[:-1]), dtype=self.polydata.ID_ARRAY_DTYPE)\
+        args = np.arange(np.prod(self.shape[:-1]), dtype=self.polydata.cell_ids_dtype)\
                     .reshape((-1, self.shape[-2]))
 
         if self.join_ends:
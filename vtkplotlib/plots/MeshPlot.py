@@ -2,10 +2,18 @@
 
 from vtkplotlib._get_vtk import vtk
 import numpy as np
+import os
+import itertools
 from pathlib import Path
+from collections import OrderedDict, namedtuple
+from concurrent.futures import (ThreadPoolExecutor, ProcessPoolExecutor,
+                                as_completed)
 
 from vtkplotlib.plots.BasePlot import ConstructedPlot
 from vtkplotlib.plots.Lines import Lines
+from vtkplotlib.plots.polydata import (PolyData, _ExtractCellsFilter,
+                                       cell_ids_dtype, ID_ARRAY_DTYPE)
+from vtkplotlib._stl import read_binary_stl, is_ascii_stl, read_ascii_stl
 
 try:
     from stl.mesh import Mesh as NumpyMesh
@@ -45,11 +53,145 @@ def vtk_read_stl(path):
     return pd
 
 
-def set_from_path(self, path, ignore_numpystl=False):
+def read_vectors(path, ignore_numpystl=False):
+    """Read an STL file into an ``(n, 3, 3)`` array or return `None` if only
+    VTK can read it. This doesn't touch VTK so it is safe to call from any
+    thread or process."""
+
+    # Binary STLs can be mapped straight from the file. This is by far the
+    # quickest option.
+    triangles = read_binary_stl(path)
+    if triangles is not None:
+        return triangles["vectors"]
+    if is_ascii_stl(path):
+        vectors = read_ascii_stl(path)
+        if vectors is not None:
+            return vectors
 
-    # Ideally let numpy-stl open the file if it is installed.
+    # Otherwise let numpy-stl open the file if it is installed.
     if NUMPY_STL_AVAILABLE and not ignore_numpystl:
-        self.vectors = NumpyMesh.from_file(path).vectors
+        return NumpyMesh.from_file(path).vectors
+
+
+MeshCacheInfo = namedtuple("MeshCacheInfo",
+                           ["hits", "misses", "max_bytes", "nbytes", "count"])
+
+
+class MeshCache(object):
+    """A least-recently-used cache of the meshes read from files by
+    `mesh_plot()`. Use the instance ``vpl.mesh_plot.cache``.
+
+    :param max_bytes: The most memory to use. The cache is disabled while this is 0.
+    :type max_bytes: int
+
+    Files are identified by their resolved path, size and modification time
+    so editing a file invalidates its entry. The vertices are stored as one
+    read-only array which every plot of that file shares. Modify a plot's
+    vertices by assigning a modified copy (e.g.
+    ``plot.vectors = plot.vectors + [10, 0, 0]``) instead of modifying them
+    in-place. Files which only VTK's STL reader can read are not cached.
+
+    .. code-block:: python
+
+        import vtkplotlib as vpl
+
+        vpl.mesh_plot.cache.max_bytes = 1 << 30
+
+        path = vpl.data.get_rabbit_stl()
+        vpl.mesh_plot(path)
+        vpl.mesh_plot(path, fig=None)  # Not re-read.
+        print(vpl.mesh_plot.cache.cache_info())
+
+    """
+
+    def __init__(self, max_bytes=0):
+        self._entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.max_bytes = max_bytes
+
+    @property
+    def max_bytes(self):
+        """The most memory to use. Lowering it evicts entries straight away.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        while self.nbytes > self._max_bytes:
+            self.nbytes -= self._entries.popitem(last=False)[1].nbytes
+
+    @staticmethod
+    def _key(path):
+        stat = os.stat(path)
+        return os.path.realpath(path), stat.st_size, stat.st_mtime_ns
+
+    def get(self, path):
+        """Get the cached ``(n, 3, 3)`` vectors for the file **path** or
+        `None` if there aren't any."""
+        if not self._max_bytes:
+            return None
+        key = self._key(path)
+        vectors = self._entries.get(key)
+        if vectors is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return vectors
+
+    def put(self, path, vectors):
+        """Cache the **vectors** read from the file **path** and return the
+        read-only copy which should be used instead."""
+        if not self._max_bytes:
+            return vectors
+        vectors = np.array(vectors, vectors.dtype)
+        vectors.flags.writeable = False
+        if vectors.nbytes > self._max_bytes:
+            return vectors
+
+        key = self._key(path)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old.nbytes
+        self._entries[key] = vectors
+        self.nbytes += vectors.nbytes
+        self._evict()
+        return vectors
+
+    def clear(self):
+        """Empty the cache and reset the statistics."""
+        self._entries.clear()
+        self.nbytes = self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def cache_info(self):
+        """Get the hit/miss statistics and memory usage, in the style of
+        `functools.lru_cache`.
+
+        :rtype: MeshCacheInfo
+
+        """
+        return MeshCacheInfo(self.hits, self.misses, self._max_bytes,
+                             self.nbytes, len(self._entries))
+
+
+def set_from_path(self, path, ignore_numpystl=False):
+    vectors = self.cache.get(path)
+    if vectors is not None:
+        self.vectors = vectors
+        return
+
+    vectors = read_vectors(path, ignore_numpystl)
+    if vectors is not None:
+        self.vectors = self.cache.put(path, vectors)
         return
 
     # Otherwise try vtk's STL reader - however it's not as reliable.
@@ -57,7 +199,7 @@ def set_from_path(self, path, ignore_numpystl=False):
     self.connect()
 
 
-def set_vertices_index_pair(self, mesh_data):
+def check_vertices_index_pair(mesh_data):
     vertices, args = mesh_data
     if not isinstance(vertices, np.ndarray):
         raise MESH_DATA_TYPE_EX("First argument is of invalid type {}".format(
@@ -79,8 +221,11 @@ def set_vertices_index_pair(self, mesh_data):
     if args.dtype.kind not in "iu":
         raise MESH_DATA_TYPE_EX("Second argument must be an int dtype array")
 
-    self.vertices = vertices
-    self.indices = args
+    return vertices, args
+
+
+def set_vertices_index_pair(self, mesh_data):
+    self.vertices, self.indices = check_vertices_index_pair(mesh_data)
 
 
 def normalise_mesh_type(self, mesh_data):
@@ -99,6 +244,12 @@ def normalise_mesh_type(self, mesh_data):
         set_vertices_index_pair(self, mesh_data)
         return
 
+    self.vectors = as_vectors(mesh_data)
+
+
+def as_vectors(mesh_data):
+    """Get the ``(n, 3, 3)`` vectors array from an in-memory mesh, either an
+    array or a mesh class."""
     # If already an array then great.
     if isinstance(mesh_data, np.ndarray):
         vectors = mesh_data
@@ -118,7 +269,7 @@ def normalise_mesh_type(self, mesh_data):
         raise MESH_DATA_TYPE_EX("mesh_data is invalid shape {}".format(
             vectors.shape))
 
-    self.vectors = vectors
+    return vectors
 
 
 class MeshPlot(ConstructedPlot):
@@ -150,6 +301,18 @@ class MeshPlot(ConstructedPlot):
     :param label: Give the plot a label to use in a `legend`.
     :type label: str
 
+    :param points_dtype: Convert the vertices to this dtype (e.g. `numpy.float32` to halve memory usage) when they are assigned, defaults to `vtkplotlib.PolyData.points_dtype`.
+    :type points_dtype: numpy.dtype
+
+    :param weld: Merge the duplicate copies of each vertex (see `weld()`), defaults to False.
+    :type weld: bool
+
+    :param smooth: Shade smoothly using per-vertex normals rather than shading each triangle flat (see `vtkplotlib.PolyData.smooth`), defaults to False. This has no visible effect unless triangles share vertices so it is usually combined with **weld**.
+    :type smooth: bool
+
+    :param strips: Render the triangles as triangle strips (see `strips`) which is faster for large static meshes, defaults to False. Use with **weld**.
+    :type strips: bool
+
     :return: A mesh object.
     :rtype: `vtkplotlib.mesh_plot`
 
@@ -300,19 +463,135 @@ class MeshPlot(ConstructedPlot):
     """
 
     def __init__(self, mesh_data, tri_scalars=None, scalars=None, color=None,
-                 opacity=None, cmap=None, fig="gcf", label=None):
+                 opacity=None, cmap=None, fig="gcf", label=None,
+                 points_dtype=None, weld=False, smooth=False, strips=False):
         super().__init__(fig)
         self.connect()
         self.shape = (0, 3, 3)
         self._last_used_default_indices = False
+        self._stripper = None
+        self._cells_filter = None
+        if points_dtype is not None:
+            self.polydata.points_dtype = points_dtype
 
         self.set_mesh_data(mesh_data)
-        del mesh_data
-
-        self.__setstate__(locals())
+        del mesh_data, points_dtype
+
+        state = locals()
+        # Not an attribute - it would shadow the weld() method.
+        del state["weld"]
+        # These need to go last as they depend on the welding (and the
+        # scalars for strips).
+        del state["smooth"], state["strips"]
+        self.__setstate__(state)
+        if weld:
+            self.weld()
+        self.smooth = smooth
+        self.strips = strips
 
     set_mesh_data = normalise_mesh_type
 
+    cache = MeshCache()
+
+    def weld(self, tolerance=0):
+        """Merge the duplicate copies of each vertex so that every triangle
+        sharing a corner uses the same point. STL files store every corner of
+        every triangle separately so this typically reduces the number of
+        points six-fold. See `vtkplotlib.PolyData.weld()`.
+
+        :param tolerance: How close vertices must be to be merged, defaults to 0 (exact duplicates only).
+        :type tolerance: float
+
+        Per-vertex **scalars** are carried over. Afterwards, any new
+        **scalars** may be given either per merged vertex (i.e. one per point
+        in `vertices`) or per corner of each triangle as before.
+
+        """
+        self.polydata.weld(tolerance)
+        self.shape = (len(self.indices), 3, 3)
+        self._last_used_default_indices = False
+
+    @property
+    def smooth(self):
+        """Shade smoothly rather than flat. See `vtkplotlib.PolyData.smooth`.
+        """
+        return self.polydata.smooth
+
+    @smooth.setter
+    def smooth(self, smooth):
+        self.polydata.smooth = smooth
+
+    @property
+    def strips(self):
+        """Render the triangles as triangle strips using VTK's vtkStripper.
+        This is the fastest way for VTK to draw a surface. The strips are
+        generated once and only regenerated if the mesh is modified so this is
+        best suited to large, static meshes. Triangles only join into strips
+        if they share vertices so call `weld()` first. Per-triangle
+        **tri_scalars** can't be used with strips.
+
+        See also `vtkplotlib.PolyData.to_strips()`.
+
+        """
+        return self._stripper is not None
+
+    @strips.setter
+    def strips(self, strips):
+        if strips:
+            if self.polydata.polygon_colors is not None:
+                raise ValueError("Triangle strips can't be used with "
+                                 "`tri_scalars`.")
+            if self._stripper is None:
+                self._stripper = vtk.vtkStripper()
+        else:
+            self._stripper = None
+        self._connect_filters()
+
+    def set_visible_cells(self, mask):
+        """Show only some of the triangles. The rest are hidden but not
+        removed.
+
+        :param mask: Which triangles to show. Either a boolean mask or an array of triangle ids. Use `None` to show all of them.
+        :type mask: numpy.ndarray
+
+        The vertices are not copied. Only the indices of the visible triangles
+        are rebuilt (see `vtkplotlib.PolyData.extract_cells()`). This is
+        cheap enough to call repeatedly, e.g. from a slider. The visible
+        subset stays up to date if the mesh is modified afterwards.
+
+        .. code-block:: python
+
+            import vtkplotlib as vpl
+            from stl.mesh import Mesh
+
+            mesh = Mesh.from_file(vpl.data.get_rabbit_stl())
+            plot = vpl.mesh_plot(mesh, tri_scalars=mesh.z.mean(1))
+
+            # Show only the top half of the rabbit.
+            plot.set_visible_cells(mesh.z.mean(1) > mesh.z.mean())
+            vpl.show()
+
+        """
+        if mask is None:
+            self._cells_filter = None
+        elif self._cells_filter is None:
+            self._cells_filter = _ExtractCellsFilter(mask)
+        else:
+            self._cells_filter.set_mask(mask)
+        self._connect_filters()
+
+    def _connect_filters(self):
+        """Connect the mapper to the polydata through any of the cells
+        subsetting or the triangle strips filters which are in use."""
+        filters = [i for i in (self._cells_filter, self._stripper) if i]
+        if not filters:
+            self.mapper.SetInputData(self.polydata.vtk_polydata)
+            return
+        filters[0].SetInputDataObject(self.polydata.vtk_polydata)
+        for (before, after) in zip(filters[:-1], filters[1:]):
+            after.SetInputConnection(before.GetOutputPort())
+        self.mapper.SetInputConnection(filters[-1].GetOutputPort())
+
     @property
     def vectors(self):
         if self._last_used_default_indices:
@@ -343,7 +622,7 @@ class MeshPlot(ConstructedPlot):
 
         else:
             # Otherwise it has to be rewritten.
-            args = np.arange(np.prod(self.shape[:-1]), dtype=self.polydata.ID_ARRAY_DTYPE)\
+            args = np.arange(np.prod(self.shape[:-1]), dtype=self.polydata.cell_ids_dtype)\
                         .reshape((-1, self.shape[-2]))
 
         self.polydata.polygons = args
@@ -367,7 +646,37 @@ class MeshPlot(ConstructedPlot):
         self.shape = i.shape + (3,)
         self._last_used_default_indices = False
 
-    scalars = Lines.color
+    @property
+    def scalars(self):
+        colors = self.polydata.point_colors
+        if colors is not None and not self._last_used_default_indices:
+            # Points aren't one per corner so look them up per corner.
+            return colors[self.indices]
+        return Lines.color.fget(self)
+
+    @scalars.setter
+    def scalars(self, scalars):
+        if not isinstance(scalars, np.ndarray) \
+                or self._last_used_default_indices:
+            Lines.color.fset(self, scalars)
+            return
+
+        # The points aren't one per corner.
+        points = len(self.vertices)
+        if scalars.shape[:2] == self.indices.shape and len(scalars) != points:
+            # One per corner as given by the getter. Scatter them to the points
+            # (where corners sharing a point disagree, the last one wins).
+            per_point = np.zeros((points,) + scalars.shape[2:], scalars.dtype)
+            per_point[self.indices] = scalars
+            scalars = per_point
+        elif len(scalars) != points:
+            raise ValueError("`scalars` should have one value per vertex ({}) "
+                             "or one per triangle corner ({}). Not {}.".format(
+                                 (points,), self.indices.shape, scalars.shape))
+
+        self.polydata.point_colors = scalars
+        if not self._freeze_scalar_range:
+            self.scalar_range = Ellipsis
 
     @property
     def tri_scalars(self):
@@ -382,17 +691,21 @@ class MeshPlot(ConstructedPlot):
     @tri_scalars.setter
     def tri_scalars(self, tri_scalars):
         if tri_scalars is not None:
+            if self.strips:
+                raise ValueError("Triangle strips can't be used with "
+                                 "`tri_scalars`.")
             if len(tri_scalars) != self.shape[0]:
                 raise ValueError("`tri_scalars` should have the same length as "
                                  "`self.vectors` or `self.args` to be one value"
                                  " per triangle.")
 
             reshaped = tri_scalars.reshape((self.shape[0], -1))
-            if 1 <= reshaped.shape[1] <= 3:
+            if 1 <= reshaped.shape[1] <= 4:
                 tri_scalars = reshaped
             else:
                 raise ValueError("`tri_scalars` should have shape ({0},), "
-                                 "({0}, 1), ({0}, 2) or ({0}, 3). Received {1}"
+                                 "({0}, 1), ({0}, 2), ({0}, 3) or ({0}, 4). "
+                                 "Received {1}"
                                  .format(self.shape[0], tri_scalars.shape)) # yapf: disable
 
         self.polydata.polygon_colors = tri_scalars
@@ -405,6 +718,89 @@ class MeshPlot(ConstructedPlot):
         del self.polydata.polygon_colors
 
 
+def mesh_plot_many(paths, workers=None, processes=False, ordered=True,
+                   progress=None, **kwargs):
+    """Plot many mesh files, reading them in parallel.
+
+    :param paths: The filenames to plot.
+    :type paths: iterable of str or os.PathLike
+
+    :param workers: How many files to read at once, defaults to the `concurrent.futures` default for the pool type.
+    :type workers: int
+
+    :param processes: Read using a pool of processes instead of threads, defaults to False.
+    :type processes: bool
+
+    :param ordered: Create the plots in the order of **paths** rather than in the order in which the files finish reading, defaults to True.
+    :type ordered: bool
+
+    :param progress: A callback, called as ``progress(done, total, path)`` after each plot is created.
+    :type progress: callable
+
+    :param kwargs: Further arguments for `mesh_plot()` which are applied to every plot.
+
+    :return: One `mesh_plot` per path in the order of **paths**.
+    :rtype: list
+
+    Only reading and parsing the files happens in the pool. The plots are
+    created in the calling thread as the results come in because VTK objects
+    are not thread safe. Binary STLs are memory-mapped and ASCII STLs are
+    parsed by numpy which are both fast enough that threads are usually all
+    that is needed. For numpy-stl's slow pure Python parsers or a large number
+    of cores, try **processes** instead. Files which only VTK can read are
+    read in the calling thread. If the `MeshCache` is enabled, cached files
+    aren't read at all and newly read files are added to it.
+
+    .. code-block:: python
+
+        import vtkplotlib as vpl
+        from pathlib import Path
+
+        paths = sorted(Path("assembly").glob("*.stl"))
+        plots = vpl.mesh_plot_many(
+            paths, workers=8,
+            progress=lambda done, total, path: print(done, "/", total, path))
+        vpl.show()
+
+    """
+    paths = [str(i) if isinstance(i, Path) else i for i in paths]
+    plots = [None] * len(paths)
+    cached = [MeshPlot.cache.get(path) for path in paths]
+    pool = (ProcessPoolExecutor if processes else ThreadPoolExecutor)(workers)
+
+    with pool:
+        futures = {
+            i: pool.submit(read_vectors, path) for (i, path) in enumerate(paths)
+            if cached[i] is None
+        }
+        if ordered:
+            results = ((i, futures[i].result() if i in futures else cached[i])
+                       for i in range(len(paths)))
+        else:
+            # Files which were cached count as done first.
+            indices = {future: i for (i, future) in futures.items()}
+            results = itertools.chain(
+                ((i, cached[i]) for i in range(len(paths)) if i not in futures),
+                ((indices[i], i.result()) for i in as_completed(indices)))
+
+        try:
+            for (count, (i, vectors)) in enumerate(results, 1):
+                if vectors is None:
+                    vectors = paths[i]
+                elif cached[i] is None:
+                    vectors = MeshPlot.cache.put(paths[i], vectors)
+                plots[i] = MeshPlot(vectors, **kwargs)
+                if progress is not None:
+                    progress(count, len(paths), paths[i])
+        except BaseException:
+            # Don't keep reading files nobody wants.
+            for future in futures.values():
+                future.cancel()
+            raise
+
+    return plots
+
+
 def mesh_plot_with_edge_scalars(mesh_data, edge_scalars, centre_scalar="mean",
                                 opacity=None, cmap=None, fig="gcf", label=None):
     r"""Like `mesh_plot` but able to add scalars per triangle's edge. By default,
@@ -456,6 +852,10 @@ def mesh_plot_with_edge_scalars(mesh_data, edge_scalars, centre_scalar="mean",
 
         (reST doesn't like it either)
 
+    The 3 smaller triangles share the centre point but each corner of the
+    original triangle is needed twice, once with the scalar for each edge it
+    touches, giving 7 points per triangle.
+
     Here is a usage example:
 
     .. code-block:: python
@@ -559,35 +959,55 @@ def mesh_plot_with_edge_scalars(mesh_data, edge_scalars, centre_scalar="mean",
 
     """
 
-    self = MeshPlot(mesh_data, fig=fig)
-    vectors = self.vectors
-    tri_centres = np.mean(vectors, 1)
-
-    new_vectors = np.empty((len(vectors) * 3, 3, 3), vectors.dtype)
-    # new_vectors.fill(np.nan)
-
-    for i in range(3):
-        for j in range(2):
-            new_vectors[i::3, j % 3] = vectors[:, (i + j) % 3]
-
-        new_vectors[i::3, 2 % 3] = tri_centres
-
-    tri_scalars = edge_scalars.ravel()
-    if centre_scalar == "mean":
+    # Get the triangles without building a plot for them.
+    if isinstance(mesh_data, Path):
+        mesh_data = str(mesh_data)
+    if isinstance(mesh_data, str):
+        vectors = MeshPlot.cache.get(mesh_data)
+        if vectors is None:
+            vectors = read_vectors(mesh_data)
+            if vectors is None:
+                polydata = vtk_read_stl(mesh_data)
+                vectors = polydata.points[polydata.polygons]
+            else:
+                vectors = MeshPlot.cache.put(mesh_data, vectors)
+    elif isinstance(mesh_data, tuple) and len(mesh_data) == 2:
+        vertices, indices = check_vertices_index_pair(mesh_data)
+        vectors = vertices[indices]
+    else:
+        vectors = as_vectors(mesh_data)
+    n = len(vectors)
+
+    # Each triangle is split into 3, one per edge, which meet at the
+    # triangle's centre. A corner takes the scalar of whichever edge it is
+    # being used for so each corner needs 2 points. The centres can be
+    # shared. Points are ordered [edge 0 start, edge 0 end, edge 1 start,
+    # ..., edge 2 end] for every triangle followed by all the centres.
+    points = np.concatenate([
+        vectors[:, [0, 1, 1, 2, 2, 0]].reshape((-1, 3)),
+        np.mean(vectors, 1),
+    ])
+    # Build the indices in the type the polydata will store them in.
+    if PolyData.compact_cell_ids:
+        indices = np.empty((n, 3, 3), cell_ids_dtype(7 * n))
+    else:
+        indices = np.empty((n, 3, 3), ID_ARRAY_DTYPE)
+    indices[:, :, :2] = np.arange(6 * n).reshape((n, 3, 2))
+    indices[:, :, 2] = np.arange(6 * n, 7 * n)[:, np.newaxis]
+
+    edge_scalars = np.asarray(edge_scalars)
+    # Any trailing dimensions for texture-coordinates or RGB scalars.
+    width = edge_scalars.shape[2:]
+    if isinstance(centre_scalar, str) and centre_scalar == "mean":
         centre_scalars = np.mean(edge_scalars, 1)
     else:
-        centre_scalars = centre_scalar
-
-    new_scalars = np.empty((len(tri_scalars), 3), dtype=tri_scalars.dtype)
-    new_scalars[:, 0] = new_scalars[:, 1] = tri_scalars
-    for i in range(3):
-        new_scalars[i::3, 2] = centre_scalars
-
-    self.vectors = new_vectors
-    self.scalars = new_scalars
-    self.opacity = opacity
-    self.fig = fig
-    self.label = label
-    self.cmap = cmap
+        centre_scalars = np.broadcast_to(centre_scalar, (n,) + width)
+    scalars = np.concatenate([
+        np.repeat(edge_scalars, 2, axis=1).reshape((6 * n,) + width),
+        centre_scalars,
+    ])
+
+    self = MeshPlot((points, indices.reshape((-1, 3))), scalars=scalars,
+                    opacity=opacity, cmap=cmap, fig=fig, label=label)
 
     return self
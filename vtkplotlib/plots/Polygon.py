@@ -25,6 +25,9 @@ class Polygon(ConstructedPlot):
     :param label: Give the plot a label to use in a `legend`.
     :type label: str
 
+    :param cells: Corner indices for each polygon if **vertices** is a flat ``(n, 3)`` array of points, defaults to one polygon per 2D array in **vertices**. Use a `vtkplotlib.RaggedCells` for polygons with differing numbers of sides.
+    :type cells: numpy.ndarray or `vtkplotlib.RaggedCells`
+
 
     VTK renders everything as only triangles. Polygons with more than 3 sides
     are broken down by VTK into multiple triangles. For non-flat polygons with
@@ -33,7 +36,7 @@ class Polygon(ConstructedPlot):
     """
 
     def __init__(self, vertices, scalars=None, color=None, opacity=None,
-                 fig="gcf", label=None):
+                 fig="gcf", label=None, cells=None):
         super().__init__(fig)
 
         # The implementation of this is actually exactly the same as Lines plot
@@ -41,9 +44,15 @@ class Polygon(ConstructedPlot):
 
         self.shape = vertices.shape[:-1]
 
-        args = np.arange(np.prod(self.shape)).reshape(self.shape)
-
         self.polydata.points = vertices.reshape((-1, 3))
+
+        if cells is None:
+            args = np.arange(np.prod(self.shape),
+                             dtype=self.polydata.cell_ids_dtype)
+            args = args.reshape(self.shape)
+        else:
+            args = cells
+
         self.polydata.polygons = args
 
         self.label = label
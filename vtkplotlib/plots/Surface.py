@@ -52,6 +52,12 @@ class Surface(ConstructedPlot):
     :param label: Give the plot a label to use in a `legend`.
     :type label: str
 
+    :param points_dtype: Convert the vertices to this dtype (e.g. `numpy.float32` to halve memory usage) when they are assigned, defaults to `vtkplotlib.PolyData.points_dtype`.
+    :type points_dtype: numpy.dtype
+
+    :param zero_copy: Give **x**, **y** and **z** to VTK as three separate arrays (see `vtkplotlib.PolyData.set_points_soa()`) instead of interleaving them into one copy, defaults to False.
+    :type zero_copy: bool
+
     :return: The surface object.
     :rtype: `vtkplotlib.surface`
 
@@ -91,15 +97,22 @@ class Surface(ConstructedPlot):
     """
 
     def __init__(self, x, y, z, scalars=None, color=None, opacity=None,
-                 texture_map=None, cmap=None, fig="gcf", label=None):
+                 texture_map=None, cmap=None, fig="gcf", label=None,
+                 points_dtype=None, zero_copy=False):
         super().__init__(fig)
+        if points_dtype is not None:
+            self.polydata.points_dtype = points_dtype
 
-        points = nuts_and_bolts.zip_axes(x, y, z)
-        flat_points = points.reshape((-1, 3))
+        if zero_copy:
+            shape = np.broadcast(x, y, z).shape
+            self.polydata.set_points_soa(x, y, z)
+        else:
+            points = nuts_and_bolts.zip_axes(x, y, z)
+            shape = points.shape[:-1]
+            self.polydata.points = points.reshape((-1, 3))
 
-        shape = points.shape[:-1]
         unflatten_map = np.arange(
-            np.prod(shape), dtype=self.polydata.ID_ARRAY_DTYPE).reshape(shape)
+            np.prod(shape), dtype=self.polydata.cell_ids_dtype).reshape(shape)
 
         corners = (
             unflatten_map[:-1, :-1],
@@ -110,7 +123,6 @@ class Surface(ConstructedPlot):
 
         args = np.concatenate([i[..., np.newaxis] for i in corners], axis=-1)
 
-        self.polydata.points = flat_points
         self.polydata.polygons = args
         self.polydata.texture_map = texture_map
         self.colors = scalars
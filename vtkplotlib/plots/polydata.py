@@ -4,9 +4,17 @@
 
 import numpy as np
 import operator
+import os
+import time
+import json
+import threading
+import weakref
+import struct
+from collections import namedtuple
 
 from vtkplotlib._get_vtk import (vtk, numpy_to_vtk, numpy_to_vtkIdTypeArray,
-                                 vtk_to_numpy, get_vtk_to_numpy_typemap)
+                                 vtk_to_numpy, get_vtk_to_numpy_typemap,
+                                 VTKPythonAlgorithmBase)
 
 ID_ARRAY_DTYPE = get_vtk_to_numpy_typemap()[vtk.VTK_ID_TYPE]
 
@@ -40,15 +48,17 @@ def cell_array_handler_property(name, doc=""):
 
     def setter(self, ids):
         if ids is not None and len(ids):
-            ids = pack_lengths(ids)
-            lines = vtk.vtkCellArray()
-            ids = np.ascontiguousarray(ids, dtype=ID_ARRAY_DTYPE)
-            lines.SetCells(len(ids), numpy_to_vtkIdTypeArray(ids.ravel()))
-            lines._numpy_reference = ids
-
-            setter_getter(self)(lines)
+            offsets, connectivity = to_offsets_connectivity(
+                ids, self.cell_ids_dtype)
+            cells = cell_array_from_csr(offsets, connectivity)
+            setter_getter(self)(cells)
+            if vtk.VTK_MAJOR_VERSION >= 9 and not connectivity.flags.writeable:
+                # VTK has wrapped read-only input. Protect it like the points.
+                self._share([cells.GetConnectivityArray()])
         else:
             setter_getter(self)(None)
+        self._share()
+        self._geometry_changed()
 
     def deleter(self):
         setter(self, None)
@@ -56,6 +66,62 @@ def cell_array_handler_property(name, doc=""):
     return property(getter, setter, deleter, doc)
 
 
+def cell_array_from_csr(offsets, connectivity):
+    """Create a ``vtkCellArray`` from the output of
+    `to_offsets_connectivity()`.
+
+    On VTK >= 9 this hands VTK its native offsets/connectivity layout directly,
+    skipping the legacy format and the conversion VTK would do from it, so that
+    nothing is copied.
+    """
+    cells = vtk.vtkCellArray()
+    if vtk.VTK_MAJOR_VERSION >= 9:
+        if offsets.dtype == ID_ARRAY_DTYPE:
+            as_vtk = numpy_to_vtkIdTypeArray
+        else:
+            as_vtk = numpy_to_vtk
+        cells.SetData(as_vtk(offsets), as_vtk(connectivity))
+        cells._numpy_reference = offsets, connectivity
+
+    else:
+        ids = pack_ragged(np.diff(offsets), connectivity)
+        cells.SetCells(len(offsets) - 1, numpy_to_vtkIdTypeArray(ids))
+        cells._numpy_reference = ids
+
+    return cells
+
+
+def cell_array_csr_property(name, which, doc=""):
+    """Read-only access to the ``"offsets"`` or ``"connectivity"`` arrays of a
+    cell array. This is the same data as returned by
+    `cell_array_handler_property` but in compressed sparse row form so that
+    cells of mixed lengths don't have to be split up.
+
+    On VTK >= 9 these are zero-copy views of the arrays VTK uses internally.
+    Otherwise they are computed from the legacy ``[n, ids...]`` layout.
+    """
+    getter_getter = operator.attrgetter("vtk_polydata.Get" + name)
+
+    def getter(self):
+        cells = getter_getter(self)()
+        if vtk.VTK_MAJOR_VERSION >= 9:
+            if which == "offsets":
+                return self._view(cells.GetOffsetsArray())
+            return self._view(cells.GetConnectivityArray())
+
+        unpacked = unpack_lengths(vtk_to_numpy(cells.GetData())) \
+            if cells.GetNumberOfCells() else []
+        if which == "offsets":
+            offsets = np.zeros(len(unpacked) + 1, ID_ARRAY_DTYPE)
+            np.cumsum([len(i) for i in unpacked], out=offsets[1:])
+            return offsets
+        if len(unpacked):
+            return np.concatenate(unpacked).astype(ID_ARRAY_DTYPE, copy=False)
+        return np.empty(0, ID_ARRAY_DTYPE)
+
+    return property(getter, None, None, doc)
+
+
 def colors_property(vtk_name, vpl_name, doc=""):
     """The colors API is identical for per-polygon colors and per-point colors.
     Therefore this ugly mess handles both to avoid duplicity of code.
@@ -70,7 +136,7 @@ def colors_property(vtk_name, vpl_name, doc=""):
         colors = getter_getter(self)().GetScalars()
         if colors is None:
             return
-        return vtk_to_numpy(colors)
+        return self._view(colors)
 
     def setter(self, colors):
 
@@ -85,7 +151,11 @@ def colors_property(vtk_name, vpl_name, doc=""):
 
             if colors.shape[1] == 1:
                 # treat colors as scalars to be passed through a colormap
-                self.color_mode = vtk.VTK_COLOR_MODE_DEFAULT
+                if colors.dtype == np.uint8:
+                    # VTK would otherwise take uint8 scalars as greyscale.
+                    self.color_mode = vtk.VTK_COLOR_MODE_MAP_SCALARS
+                else:
+                    self.color_mode = vtk.VTK_COLOR_MODE_DEFAULT
 
             elif colors.shape[1] == 2:
                 # treat colors as texture coordinates to be passed through a texturemap
@@ -96,11 +166,16 @@ def colors_property(vtk_name, vpl_name, doc=""):
                         "A texture map must be provided in polydata.texture_map to use uv scalars."
                     )
                 colors = self.texture_map(colors)
+                if self.quantize_colors:
+                    colors = vpl_colors.quantize(colors)
                 # self.color_mode = vtk.VTK_COLOR_MODE_MAP_SCALARS
                 self.color_mode = vtk.VTK_COLOR_MODE_DIRECT_SCALARS
 
-            elif colors.shape[1] == 3:
-                # treat colors as raw RGB values
+            elif colors.shape[1] in (3, 4):
+                # treat colors as raw RGB(A) values. These can be either floats
+                # between 0 and 1 or uint8s between 0 and 255.
+                if self.quantize_colors:
+                    colors = vpl_colors.quantize(colors)
                 self.color_mode = vtk.VTK_COLOR_MODE_DIRECT_SCALARS
 
             else:
@@ -112,6 +187,7 @@ def colors_property(vtk_name, vpl_name, doc=""):
             colors._numpy_ref = self._colors
 
         getter_getter(self)().SetScalars(colors)
+        self._share()
         setattr(self, "color_source", vpl_name)
 
     def deleter(self):
@@ -120,7 +196,36 @@ def colors_property(vtk_name, vpl_name, doc=""):
     return property(getter, setter, deleter, doc)
 
 
+RaggedCells = namedtuple("RaggedCells", ["lengths", "connectivity"])
+RaggedCells.__doc__ = """Cells of differing lengths stored as two flat arrays
+rather than a list of arrays. **lengths** holds the number of points in each
+cell and **connectivity** holds every cell's point ids back to back.
+
+This can be assigned directly to `PolyData.lines` or `PolyData.polygons` or
+passed as the **cells** argument of `vtkplotlib.plot()` or
+`vtkplotlib.polygon()`, avoiding building a Python list of arrays.
+
+.. code-block:: python
+
+    # The same as [[0, 1, 2], [3, 4], [5, 6, 7, 8]].
+    RaggedCells(lengths=[3, 2, 4], connectivity=np.arange(9))
+
+"""
+
+
 def join_line_ends(lines):
+    if isinstance(lines, RaggedCells):
+        lengths = np.asarray(lines.lengths, ID_ARRAY_DTYPE)
+        connectivity = np.asarray(lines.connectivity, ID_ARRAY_DTYPE)
+        ends = np.cumsum(lengths)
+        # Like below, prepend each line's last point. Empty lines are skipped.
+        non_empty = lengths > 0
+        ends = ends[non_empty]
+        starts = ends - lengths[non_empty]
+        return RaggedCells(
+            lengths + non_empty,
+            np.insert(connectivity, starts, connectivity[ends - 1]))
+
     lines = np.asarray(lines)
 
     if lines.dtype == object:
@@ -147,11 +252,17 @@ def pack_lengths(arrays):
         ...               [25, 26, 27, 28]])
         array([ 3, 20, 21, 22,  2, 23, 24,  4, 25, 26, 27, 28])
 
+    **arrays** may also be a `RaggedCells` pair of flat arrays which is the
+    fastest option for cells of mixed lengths.
+
     .. seealso:
 
         unpack_lengths for the reverse.
     """
 
+    if isinstance(arrays, RaggedCells):
+        return pack_ragged(*arrays)
+
     if isinstance(arrays, np.ndarray) and arrays.dtype != object:
         # This is just a regular numpy array with equal-lengthed rows.
         # Prepend an extra column containing the row length.
@@ -164,12 +275,108 @@ def pack_lengths(arrays):
 
         return out
 
-    # Otherwise do it the slow way.
-    flat = []
-    for array in arrays:
-        flat.append(len(array))
-        flat.extend(array)
-    return np.array(flat, dtype=ID_ARRAY_DTYPE)
+    # Otherwise flatten into a (lengths, connectivity) pair.
+    arrays = list(arrays)
+    lengths = np.fromiter(map(len, arrays), ID_ARRAY_DTYPE, len(arrays))
+    if lengths.sum():
+        connectivity = np.concatenate(arrays)
+    else:
+        connectivity = np.empty(0, ID_ARRAY_DTYPE)
+    return pack_ragged(lengths, connectivity)
+
+
+def pack_ragged(lengths, connectivity):
+    """Pack cells given as a flat array of cell **lengths** and a flat array
+    of point ids (**connectivity**) into VTK's compound cell array format.
+    See `pack_lengths()`.
+
+    ..doctest::
+
+        >>> pack_ragged([3, 2, 4], [20, 21, 22, 23, 24, 25, 26, 27, 28])
+        array([ 3, 20, 21, 22,  2, 23, 24,  4, 25, 26, 27, 28])
+
+    """
+    lengths = np.asarray(lengths, ID_ARRAY_DTYPE).ravel()
+    connectivity = np.asarray(connectivity).ravel()
+
+    if lengths.sum() != len(connectivity):
+        raise ValueError("The cell lengths add up to {} but {} point ids were "
+                         "given.".format(lengths.sum(), len(connectivity)))
+
+    out = np.empty(len(lengths) + len(connectivity), ID_ARRAY_DTYPE)
+
+    # Each length header is shifted right by one slot for every earlier header.
+    # Each point id is shifted right by one slot for every header up to and
+    # including its own cell's.
+    headers = np.cumsum(lengths) - lengths + np.arange(len(lengths))
+    out[headers] = lengths
+    shifts = np.repeat(np.arange(1, len(lengths) + 1), lengths)
+    out[np.arange(len(connectivity)) + shifts] = connectivity
+
+    return out
+
+
+def to_offsets_connectivity(arrays, dtype=ID_ARRAY_DTYPE):
+    """Convert cells into the compressed sparse row layout used internally by
+    VTK >= 9's ``vtkCellArray``. Cell ``i`` is
+    ``connectivity[offsets[i]: offsets[i + 1]]``. Accepts the same inputs as
+    `pack_lengths()`.
+
+    ..doctest::
+
+        >>> to_offsets_connectivity([[20, 21, 22],
+        ...                          [23, 24],
+        ...                          [25, 26, 27, 28]])
+        (array([0, 3, 5, 9]), array([20, 21, 22, 23, 24, 25, 26, 27, 28]))
+
+    Both outputs are contiguous and of type **dtype** unless there are too
+    many ids for **dtype** to hold the offsets, in which case they are
+    `ID_ARRAY_DTYPE`. For regular arrays of the output dtype, **connectivity**
+    is a view of the input.
+    """
+    if isinstance(arrays, RaggedCells):
+        lengths, connectivity = arrays
+        lengths = np.asarray(lengths).ravel()
+        connectivity = np.asarray(connectivity).ravel()
+        if lengths.sum() != len(connectivity):
+            raise ValueError("The cell lengths add up to {} but {} point ids "
+                             "were given.".format(lengths.sum(),
+                                                  len(connectivity)))
+
+    elif isinstance(arrays, np.ndarray) and arrays.dtype != object:
+        arrays = arrays.reshape((-1, arrays.shape[-1]))
+        dtype = _widen_if_needed(dtype, arrays.size)
+        offsets = np.arange(len(arrays) + 1, dtype=dtype)
+        offsets *= arrays.shape[1]
+        return offsets, np.ascontiguousarray(arrays, dtype).ravel()
+
+    else:
+        arrays = list(arrays)
+        lengths = np.fromiter(map(len, arrays), ID_ARRAY_DTYPE, len(arrays))
+        if lengths.sum():
+            connectivity = np.concatenate(arrays)
+        else:
+            connectivity = np.empty(0, dtype)
+
+    dtype = _widen_if_needed(dtype, len(connectivity))
+    offsets = np.zeros(len(lengths) + 1, dtype)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets, np.ascontiguousarray(connectivity, dtype)
+
+
+def _widen_if_needed(dtype, max_value):
+    if max_value > np.iinfo(dtype).max:
+        return ID_ARRAY_DTYPE
+    return dtype
+
+
+def cell_ids_dtype(point_count):
+    """Choose the narrowest integer type VTK can store cells in which can index
+    **point_count** points. This is 32-bit on VTK >= 9 for anything less than
+    2 billion points, halving the memory used by lines and polygons."""
+    if vtk.VTK_MAJOR_VERSION >= 9 and 0 < point_count <= np.iinfo(np.int32).max:
+        return np.dtype(np.int32)
+    return np.dtype(ID_ARRAY_DTYPE)
 
 
 def unpack_lengths(arr):
@@ -207,6 +414,266 @@ def unpack_lengths(arr):
         return out
 
 
+def _concatenate_into(arrays, shifts=None, dtype=None):
+    """Like `numpy.concatenate` but optionally adds a different constant to
+    each input without any intermediate copies."""
+    arrays = [np.asarray(i) for i in arrays]
+    dtype = dtype or np.result_type(*arrays)
+    out = np.empty((sum(map(len, arrays)),) + arrays[0].shape[1:], dtype)
+    start = 0
+    for (i, array) in enumerate(arrays):
+        end = start + len(array)
+        if shifts is None:
+            out[start:end] = array
+        else:
+            np.add(array, shifts[i], out=out[start:end], casting="unsafe")
+        start = end
+    return out
+
+
+def _fill_missing(colors, lengths):
+    """Replace each `None` in a list of colors with zeros of the same width and
+    dtype as the others. RGB(A) colors are quantized if any of them are
+    already ``uint8`` so that they are all on the same 0-255 scale."""
+    present = [i for i in colors if i is not None]
+    if present[0].shape[1:] in ((3,), (4,)) \
+            and any(i.dtype == np.uint8 for i in present):
+        colors = [None if i is None else vpl_colors.quantize(i) for i in colors]
+        present = [i for i in colors if i is not None]
+    dtype = np.result_type(*present)
+    return [
+        np.zeros((n,) + present[0].shape[1:], dtype) if i is None else i
+        for (i, n) in zip(colors, lengths)
+    ]
+
+
+# The first bytes of a file written by `PolyData.save()`.
+_FILE_MAGIC = b"VPLPOLY\x00"
+# Every array in a saved file starts on a multiple of this.
+_PAGE_SIZE = 4096
+
+
+def _round_up(size, multiple=_PAGE_SIZE):
+    return -(-size // multiple) * multiple
+
+
+_SHARED_MEMORY_MAGIC = b"VPLSHM\x00\x00"
+# The magic, the version counter and the header size at the start of a block
+# written by `PolyData.to_shared_memory()`.
+_SHARED_PREFIX = struct.Struct("<8sQQ")
+
+_resource_tracker_lock = threading.Lock()
+
+
+def _open_shared_memory(name):
+    """Attach to an existing shared memory block without letting Python's
+    resource tracker delete it when this process exits."""
+    from multiprocessing.shared_memory import SharedMemory
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:
+        pass
+    # Python < 3.13 has no track option. The resource tracker is usually shared
+    # by all related processes so registering then unregistering would also
+    # undo the creator's registration. Skip registering this block altogether
+    # instead. Anything else registered meanwhile (e.g. by another thread)
+    # is passed through.
+    from multiprocessing import resource_tracker
+    with _resource_tracker_lock:
+        register = resource_tracker.register
+
+        def register_others(name_, rtype):
+            if rtype != "shared_memory" or name_.lstrip("/") != name:
+                register(name_, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            return SharedMemory(name)
+        finally:
+            resource_tracker.register = register
+
+
+def _read_shared_prefix(block):
+    magic, version, header_size = _SHARED_PREFIX.unpack_from(block.buf, 0)
+    if magic != _SHARED_MEMORY_MAGIC:
+        raise ValueError("Shared memory block {!r} was not written by "
+                         "PolyData.to_shared_memory().".format(block.name))
+    return version, header_size
+
+
+def _polygon_normals(points, offsets, connectivity):
+    """Calculate the normal of each polygon using Newell's method. Unlike the
+    cross product of two edges, this works for any polygon. The normals are
+    not normalised. Their lengths are twice the polygons' areas."""
+    points = np.asarray(points, np.float64)
+    lengths = np.diff(offsets)
+
+    # The position in `connectivity` of the next corner around each polygon.
+    next_ = np.arange(1, len(connectivity) + 1)
+    ends = offsets[1:][lengths > 0]
+    next_[ends - 1] = offsets[:-1][lengths > 0]
+
+    crosses = np.cross(points[connectivity], points[connectivity[next_]])
+    normals = np.zeros((len(lengths), 3))
+    if len(crosses):
+        # reduceat() can't handle empty polygons so sum only the non-empty
+        # ones and leave the rest as zeros.
+        normals[lengths > 0] = np.add.reduceat(crosses,
+                                               offsets[:-1][lengths > 0])
+    return normals
+
+
+def _normalise(vectors):
+    lengths = np.sqrt((vectors * vectors).sum(-1))[..., np.newaxis]
+    nonzero = lengths > 0
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors),
+                     where=nonzero)
+
+
+def _take_cells(offsets, connectivity, ids):
+    """Select the cells **ids** from cells in offsets/connectivity form.
+    Returns the new offsets and connectivity."""
+    lengths = np.diff(offsets)[ids]
+    new_offsets = np.zeros(len(lengths) + 1, offsets.dtype)
+    np.cumsum(lengths, out=new_offsets[1:])
+    # The position in the old connectivity of each new connectivity item.
+    shifts = np.repeat(offsets[:-1][ids] - new_offsets[:-1], lengths)
+    return new_offsets, connectivity[shifts + np.arange(new_offsets[-1])]
+
+
+def _take_arrays(source, target, index):
+    """Copy every array in the vtkPointData or vtkCellData **source** into
+    **target**, keeping only the tuples at **index**. **source** and
+    **target** may be the same."""
+    arrays = [(source.GetArray(i), source.IsArrayAnAttribute(i))
+              for i in range(source.GetNumberOfArrays())]
+    target.Initialize()
+    for (old, attribute) in arrays:
+        if old is None:
+            # Not a numeric array.
+            continue
+        array = np.ascontiguousarray(vtk_to_numpy(old)[index])
+        new = numpy_to_vtk(array)
+        new._numpy_reference = array
+        new.SetName(old.GetName())
+        if attribute >= 0:
+            target.SetAttribute(new, attribute)
+        else:
+            target.AddArray(new)
+
+
+class _ExtractCellsFilter(VTKPythonAlgorithmBase):
+    """A VTK filter which applies `PolyData.extract_cells()` to its input.
+    Being part of the pipeline, it re-runs only when its input or **mask**
+    changes."""
+
+    def __init__(self, mask=None):
+        VTKPythonAlgorithmBase.__init__(self, inputType="vtkPolyData")
+        self.mask = mask
+
+    def set_mask(self, mask):
+        self.mask = mask
+        self.Modified()
+
+    def RequestData(self, request, in_info, out_info):
+        input = vtk.vtkPolyData.GetData(in_info[0])
+        output = vtk.vtkPolyData.GetData(out_info)
+        output.ShallowCopy(PolyData(input).extract_cells(self.mask)
+                           .vtk_polydata) # yapf: disable
+        return 1
+
+
+def _is_soa(data):
+    """Is the vtkDataArray **data** stored as one array per component rather
+    than interleaved?"""
+    return "SOA" in data.GetArrayTypeAsString().upper()
+
+
+def _soa_components(data):
+    """Get the numpy arrays behind a structure-of-arrays vtkDataArray made by
+    `PolyData.set_points_soa()`. Returns `None` for any other array."""
+    return getattr(data, "_numpy_components", None)
+
+
+def _alive(ref):
+    """Is whatever the weakref **ref** points to still around? A **ref** of
+    `None` means forever."""
+    return ref is None or ref() is not None
+
+
+def _byte_bounds(array):
+    """Get the start and end addresses of the memory used by **array**."""
+    low = high = array.__array_interface__["data"][0]
+    for (length, stride) in zip(array.shape, array.strides):
+        if length == 0:
+            return low, low
+        if stride < 0:
+            low += (length - 1) * stride
+        else:
+            high += (length - 1) * stride
+    return low, high + array.itemsize
+
+
+class _ByteCounter(object):
+    """Count the memory used by numpy arrays, counting memory shared between
+    arrays only once."""
+
+    def __init__(self):
+        # Non-overlapping (start, end, owner) memory ranges seen so far.
+        self.seen = []
+
+    def add(self, array, owner=None):
+        """Count **array**. Returns the number of bytes not already counted and
+        the **owner** of the first already counted memory it overlaps (or
+        `None` if it is all new)."""
+        pieces = [_byte_bounds(array)]
+        overlapped = None
+        for (low, high, seen_owner) in self.seen:
+            remaining = []
+            for (start, end) in pieces:
+                if start < high and low < end:
+                    if overlapped is None:
+                        overlapped = seen_owner
+                    remaining += [(a, b) for (a, b) in ((start, min(end, low)),
+                                                        (max(start, high), end))
+                                  if a < b] # yapf: disable
+                else:
+                    remaining.append((start, end))
+            pieces = remaining
+        self.seen += [(start, end, owner) for (start, end) in pieces]
+        return sum(end - start for (start, end) in pieces), overlapped
+
+
+class _GrowableArray(object):
+    """An array with spare capacity at the end so that appending to it is
+    amortized O(1). The capacity doubles whenever it runs out."""
+
+    def __init__(self, initial, dtype=None):
+        initial = np.asarray(initial, dtype)
+        self.buffer = initial.copy()
+        self.size = len(initial)
+
+    @property
+    def array(self):
+        """The used part of the buffer."""
+        return self.buffer[:self.size]
+
+    def extend(self, values):
+        values = np.asarray(values)
+        new_size = self.size + len(values)
+
+        if new_size > len(self.buffer):
+            capacity = max(new_size, 2 * len(self.buffer))
+            buffer = np.empty((capacity,) + self.buffer.shape[1:],
+                              self.buffer.dtype)
+            buffer[:self.size] = self.array
+            self.buffer = buffer
+
+        self.buffer[self.size:new_size] = values
+        self.size = new_size
+        return self.array
+
+
 SCALAR_MODES_TO_STRINGS = {
     vtk.VTK_SCALAR_MODE_DEFAULT: None,
     vtk.VTK_SCALAR_MODE_USE_CELL_DATA: "polygon_colors",
@@ -248,19 +715,31 @@ class PolyData(object):
     |                    |         |               | a the corners of a polygon.   |
     +--------------------+---------+---------------+-------------------------------+
     | ``point_colors``   | `float` | | ``(a,)`` or | Per-point scalars, texture    |
-    |                    |         |   ``(a, 1)``  | coordinates or RGB values,    |
+    |                    |         |   ``(a, 1)``  | coordinates or RGB(A) values, |
     |                    |         | | ``(a, 2)``  | depending on the shape.       |
     |                    |         | | ``(a, 3)``  |                               |
+    |                    |         | | ``(a, 4)``  |                               |
     +--------------------+---------+---------------+-------------------------------+
     | ``polygon_colors`` | `float` | | ``(c,)`` or | Per-polygon scalars, texture  |
-    |                    |         |   ``(c, 1)``  | coordinates or RGB values,    |
+    |                    |         |   ``(c, 1)``  | coordinates or RGB(A) values, |
     |                    |         | | ``(c, 2)``  | depending on the shape.       |
     |                    |         | | ``(c, 3)``  |                               |
+    |                    |         | | ``(c, 4)``  |                               |
     +--------------------+---------+---------------+-------------------------------+
 
     Where ``a``, ``b`` and ``c`` are defined as the numbers of vertices, lines
     and polygons respectively.
 
+    RGB(A) colors may be either floats between 0 and 1 or, using an eighth of
+    the memory of ``float64``, ``uint8`` values between 0 and 255. Set
+    ``quantize_colors = True`` to convert floats to the latter automatically.
+
+    Lines and polygons of mixed lengths come out of ``lines`` and ``polygons``
+    as lists of arrays which is slow for large meshes. The read-only
+    ``lines_offsets``, ``lines_connectivity``, ``polygons_offsets`` and
+    ``polygons_connectivity`` attributes give the same information as two
+    flat arrays each without any Python level looping.
+
     The points aren't visible themselves - to create some kind of points plot
     use `vtkplotlib.scatter()`.
 
@@ -299,43 +778,259 @@ class PolyData(object):
 
     """
 
-    def __init__(self, vtk_polydata=None, mapper=None):
+    def __init__(self, vtk_polydata=None, mapper=None, points_dtype=None):
         self.vtk_polydata = vtk_polydata or vtk.vtkPolyData()
         self.mapper = mapper or vtk.vtkPolyDataMapper()
+        if points_dtype is not None:
+            self.points_dtype = points_dtype
 
         self.texture_map = None
-        self._temp = []
+        self._points_view = None
+        # The (vtkDataArray, weakref to whoever it's shared with) pairs for
+        # arrays shared with a `shallow_copy()`. The weakref is None for
+        # read-only input which is shared with whoever owns it indefinitely.
+        self._shared = []
+        # The (vtkDataArray, MTime, (min, max)) of each colors array. See
+        # `_colors_range()`.
+        self._colors_ranges = {}
+        self._auto_scalar_range = False
+        # Buffers used by the append_*() methods and the VTK objects they last
+        # produced. See `_growable()`.
+        self._growables = {}
+        # The (SharedMemory, version) if from `from_shared_memory()`.
+        self._shared_memory = None
+        # The (points vtkDataArray, its MTime, polygons vtkCellArray, its
+        # MTime, point normals, polygon normals). See `_normals()`.
+        self._normals_cache = None
+        self._smooth = False
+        # The (MTime, PolyData) last returned by `to_strips()`.
+        self._strips_cache = None
 
     @property
     def points(self):
         points = self.vtk_polydata.GetPoints()
         if points is None:
             return None
-        else:
-            data = points.GetData()
-            self._temp.append(data)
-            return vtk_to_numpy(data)
+        data = points.GetData()
+
+        # Reuse the numpy view from last time unless the underlying
+        # vtkDataArray has been swapped out or resized (which may reallocate).
+        # Holding ``data`` in the cache also keeps the view's buffer alive.
+        # Structure-of-arrays points can only be read as an interleaved copy
+        # which must also be refreshed whenever the points are modified. The
+        # view is read-only whilst the points are shared so it must also be
+        # refreshed when they stop or start being shared.
+        cached = self._points_view
+        shared = self._is_shared(data)
+        if cached is None or cached[0] is not data \
+                or len(cached[1]) != data.GetNumberOfTuples() \
+                or cached[2] != data.GetMTime() or cached[3] != shared:
+            self._points_view = cached = \
+                (data, self._view(data), data.GetMTime(), shared)
+        return cached[1]
 
     @points.setter
     def points(self, vertices):
-        vertices = np.ascontiguousarray(vertices)
-        # Store this to keep its data from being garbage collected.
-        self._vertices = vertices
-
         if vertices is None:
+            self._vertices = None
             self.vtk_polydata.SetPoints(None)
         else:
-            points = self.vtk_polydata.GetPoints() or vtk.vtkPoints()
+            vertices = np.ascontiguousarray(vertices, self.points_dtype)
+            # Store this to keep its data from being garbage collected.
+            self._vertices = vertices
+
+            # Always use a new vtkPoints as the current one may be shared with
+            # a shallow copy.
+            points = vtk.vtkPoints()
             points.SetData(numpy_to_vtk(vertices))
             points._numpy_reference = vertices
             self.vtk_polydata.SetPoints(points)
+            if not vertices.flags.writeable:
+                # Treat read-only input like a `shallow_copy()`'s arrays so
+                # that it is never modified in-place.
+                self._share([points.GetData()])
+        # Don't let the cached view keep the old points alive.
+        self._points_view = None
+        self._share()
+        self._geometry_changed()
+
+    def set_points_soa(self, x, y, z):
+        """Set the `points` from separate x, y and z arrays without
+        interleaving them into one ``(n, 3)`` array.
+
+        :param x: The x components.
+        :type x: numpy.ndarray
+
+        :param y: The y components.
+        :type y: numpy.ndarray
+
+        :param z: The z components.
+        :type z: numpy.ndarray
+
+        The arrays are broadcast against each other then flattened. Any which
+        are already contiguous, full sized and of the right dtype are used by
+        VTK as-is (so modifying them afterwards modifies the points). The
+        others are copied individually. This saves the two full copies of the
+        geometry that ``polydata.points = vpl.zip_axes(x, y, z)`` makes.
+
+        Reading `points` afterwards gives a read-only interleaved copy. Use
+        `update_points()` to modify the points in-place.
+
+        Requires VTK >= 9. Older versions fall back to interleaving.
+
+        """
+        dtype = self.points_dtype or np.result_type(x, y, z)
+        dtype = np.promote_types(dtype, np.float32)
+        axes = [
+            np.ascontiguousarray(i, dtype).ravel()
+            for i in np.broadcast_arrays(x, y, z)
+        ]
+
+        if vtk.VTK_MAJOR_VERSION < 9 \
+                or not hasattr(vtk, "vtkSOADataArrayTemplate"):
+            from vtkplotlib.nuts_and_bolts import zip_axes
+            self.points = zip_axes(*axes)
+            return
+
+        data = vtk.vtkSOADataArrayTemplate[dtype.name]()
+        data.SetNumberOfComponents(3)
+        for (i, axis) in enumerate(axes):
+            data.SetArray(i, axis, len(axis), True, True)
+        data._numpy_components = axes
+        self._vertices = axes
+
+        points = vtk.vtkPoints()
+        points.SetData(data)
+        self.vtk_polydata.SetPoints(points)
+        self._points_view = None
+        self._share()
+        self._geometry_changed()
+
+    @property
+    def point_normals(self):
+        """The unit normal at each point, computed from the `polygons` around
+        it (weighted by area). Points not in any polygon get zeros.
+
+        This is calculated once then cached until the `points` or `polygons`
+        change. It is read-only. See also `smooth`.
+
+        """
+        return self._normals()[0]
+
+    @property
+    def polygon_normals(self):
+        """The unit normal of each polygon. A polygon's normal points towards
+        the side from which its corners go anticlockwise. See
+        `point_normals`."""
+        return self._normals()[1]
+
+    def _normals(self):
+        points = self.vtk_polydata.GetPoints()
+        if points is None:
+            return None, None
+        data = points.GetData()
+        polygons = self.vtk_polydata.GetPolys()
+        key = (data, data.GetMTime(), polygons, polygons.GetMTime())
+
+        cached = self._normals_cache
+        if cached is None or cached[0] is not data or cached[1] != key[1] \
+                or cached[2] is not polygons or cached[3] != key[3]:
+            offsets = self.polygons_offsets
+            connectivity = self.polygons_connectivity
+            polygon_normals = _polygon_normals(self.points, offsets,
+                                               connectivity)
+            point_normals = np.empty((len(self.points), 3))
+            corner_normals = np.repeat(polygon_normals, np.diff(offsets), 0)
+            for axis in range(3):
+                point_normals[:, axis] = np.bincount(
+                    connectivity, corner_normals[:, axis],
+                    minlength=len(point_normals))
+
+            normals = []
+            for array in (point_normals, polygon_normals):
+                array = _normalise(array).astype(np.float32)
+                array.flags.writeable = False
+                normals.append(array)
+            self._normals_cache = cached = key + tuple(normals)
+        return cached[4:]
+
+    @property
+    def smooth(self):
+        """Shade smoothly using `point_normals` rather than giving each
+        polygon a flat shade. The normals are kept up to date whenever the
+        `points` or `polygons` are changed via this class."""
+        return self._smooth
+
+    @smooth.setter
+    def smooth(self, smooth):
+        self._smooth = bool(smooth)
+        if self._smooth:
+            self._geometry_changed()
+        else:
+            self.vtk_polydata.GetPointData().SetNormals(None)
+
+    def _geometry_changed(self):
+        """Refresh anything derived from the points or cells which VTK needs
+        up front."""
+        if not getattr(self, "_smooth", False):
+            return
+        point_data = self.vtk_polydata.GetPointData()
+        normals = self.point_normals
+        if normals is None or not len(normals):
+            point_data.SetNormals(None)
+            return
+        array = numpy_to_vtk(normals)
+        array._numpy_reference = normals
+        array.SetName("Normals")
+        point_data.SetNormals(array)
 
     lines = cell_array_handler_property("Lines")
 
     polygons = cell_array_handler_property("Polys")
 
+    lines_offsets = cell_array_csr_property(
+        "Lines", "offsets", """Where each line starts and ends in
+        `lines_connectivity`. Line ``i`` passes through the points
+        ``lines_connectivity[lines_offsets[i]: lines_offsets[i + 1]]``.""")
+    lines_connectivity = cell_array_csr_property(
+        "Lines", "connectivity",
+        """The point ids of every line joined into one flat array.""")
+    polygons_offsets = cell_array_csr_property(
+        "Polys", "offsets", """Where each polygon starts and ends in
+        `polygons_connectivity`. Polygon ``i``'s corners are the points
+        ``polygons_connectivity[polygons_offsets[i]: polygons_offsets[i + 1]]``.
+        """)
+    polygons_connectivity = cell_array_csr_property(
+        "Polys", "connectivity",
+        """The point ids of every polygon joined into one flat array.""")
+
     ID_ARRAY_DTYPE = globals()["ID_ARRAY_DTYPE"]
 
+    points_dtype = None
+    """If not `None`, convert ``points`` to this dtype when they are assigned.
+    Use ``numpy.float32`` to halve the memory and the upload bandwidth used by
+    points compared to ``float64``. Set it either on an instance or on the
+    class to change the default for all plots."""
+
+    quantize_colors = False
+    """Convert floating point RGB(A) ``point_colors`` and ``polygon_colors``
+    to ``uint8`` (see `vtkplotlib.colors.quantize()`) when they are assigned.
+    This cuts the memory used by ``float64`` colors eightfold. Set it either on
+    an instance or on the class."""
+
+    compact_cell_ids = True
+    """Store lines and polygons as 32-bit ids where possible. Set to False
+    (either on an instance or on the class) to always use VTK's native 64-bit
+    id type."""
+
+    @property
+    def cell_ids_dtype(self):
+        """The integer type that lines and polygons will be stored as. Cells
+        given in this dtype can be passed to VTK without copying."""
+        if self.compact_cell_ids:
+            return cell_ids_dtype(self.vtk_polydata.GetNumberOfPoints())
+        return np.dtype(ID_ARRAY_DTYPE)
+
     def __repr__(self):
         out = ["%s {\n" % self.__class__.__name__]
         for i in "points lines polygons".split():
@@ -368,11 +1063,452 @@ class PolyData(object):
                 setattr(self, *i)
 
     def __deepcopy__(self, memo):
-        import pickle
-        return pickle.loads(pickle.dumps(self))
+        return self.copy()
 
     def copy(self):
-        return self.__deepcopy__(None)
+        """Create an independent copy. The underlying arrays are duplicated
+        directly by VTK.
+
+        :rtype: `PolyData`
+
+        """
+        new = self.__class__()
+        new.vtk_polydata.DeepCopy(self.vtk_polydata)
+        self._copy_settings_to(new)
+        return new
+
+    def shallow_copy(self):
+        """Create a copy which shares all its arrays with this polydata so
+        that it costs next to nothing to create.
+
+        :rtype: `PolyData`
+
+        Assigning to an attribute of either polydata (e.g.
+        ``copy.points = new_points``) affects only that polydata. To stop
+        either side from modifying the other in-place, arrays which are still
+        shared are given out read-only. Assign a modified copy instead or use
+        one of the ``update_*()`` methods which copy the array first. Once
+        either polydata is deleted, the other's arrays become writable
+        again.
+
+        .. code-block:: python
+
+            copy = polydata.shallow_copy()
+            copy.points = copy.points + [10, 0, 0]
+
+        """
+        new = self.__class__()
+        new.vtk_polydata.ShallowCopy(self.vtk_polydata)
+        self._copy_settings_to(new)
+
+        shared = list(self._buffers())
+        self._share(shared, new)
+        new._share(shared, self)
+        return new
+
+    _saved_arrays = ("points", "lines_offsets", "lines_connectivity",
+                     "polygons_offsets", "polygons_connectivity",
+                     "point_colors", "polygon_colors")
+
+    def save(self, path):
+        """Write to a file which can be reopened near-instantly using `load()`.
+
+        :param path: The filename to write to.
+        :type path: str or os.PathLike
+
+        The format is uncompressed and deliberately simple: a small JSON header
+        followed by the raw contents of `points`, the `lines` and `polygons`
+        (as offsets and connectivity) and the colors, each starting at a page
+        boundary. Colors are saved as they are stored so texture coordinates
+        are saved as the RGB values they were converted to. The colormap and
+        texture map are not saved.
+
+        """
+        header, arrays = self._layout()
+        layout = header["arrays"]
+        header = json.dumps(header).encode()
+
+        with open(path, "wb") as f:
+            f.write(_FILE_MAGIC + struct.pack("<Q", len(header)) + header)
+            start = _round_up(f.tell())
+            for (name, array) in arrays.items():
+                f.seek(start + layout[name][0])
+                f.write(memoryview(array))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Read a file written by `save()`.
+
+        :param path: The filename to read.
+        :type path: str or os.PathLike
+
+        :param mmap: Memory-map the arrays rather than reading them, defaults to True.
+        :type mmap: bool
+
+        :rtype: `PolyData`
+
+        With **mmap** the arrays are `numpy.memmap` views which are given
+        straight to VTK so loading costs next to nothing regardless of size.
+        Only the parts of the file which are actually used (usually when first
+        rendered) are read from disk. The maps are copy-on-write so modifying
+        the loaded polydata never writes back to the file.
+
+        """
+        with open(path, "rb") as f:
+            if f.read(len(_FILE_MAGIC)) != _FILE_MAGIC:
+                raise ValueError(
+                    "{!r} is not a file written by PolyData.save().".format(
+                        str(path)))
+            size, = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(size).decode())
+            start = _round_up(f.tell())
+
+        arrays = {}
+        for (name, (offset, dtype, shape)) in header["arrays"].items():
+            shape = tuple(shape)
+            if mmap and np.prod(shape):
+                arrays[name] = np.memmap(path, dtype, "c", start + offset,
+                                         shape)
+            else:
+                count = int(np.prod(shape))
+                arrays[name] = np.fromfile(str(path), dtype, count,
+                                           offset=start + offset)
+                arrays[name] = arrays[name].reshape(shape)
+        return cls._from_layout(header, arrays)
+
+    def _layout(self):
+        """Describe this polydata in the form used by `save()` and
+        `to_shared_memory()`. Returns a JSON-able header, which includes where
+        each array should be put relative to the start of the data, and a
+        dictionary of contiguous arrays."""
+        arrays = {}
+        for name in self._saved_arrays:
+            array = getattr(self, name)
+            if array is not None:
+                arrays[name] = np.ascontiguousarray(array)
+
+        if self._auto_scalar_range:
+            scalar_range = None
+        else:
+            scalar_range = list(self.scalar_range)
+        header = {
+            "version": 1,
+            "color_source": self.color_source,
+            "color_mode": self.color_mode,
+            "scalar_range": scalar_range,
+            "arrays": {},
+        }
+        offset = 0
+        for (name, array) in arrays.items():
+            header["arrays"][name] = [offset, array.dtype.str, array.shape]
+            offset = _round_up(offset + array.nbytes)
+        header["size"] = offset
+        return header, arrays
+
+    @classmethod
+    def _from_layout(cls, header, arrays):
+        """The reverse of `_layout()`. The **arrays** are used without
+        copying."""
+        self = cls()
+        if "points" in arrays:
+            self.points = arrays["points"]
+        for (vtk_name, name) in (("Lines", "lines"), ("Polys", "polygons")):
+            offsets = arrays.get(name + "_offsets")
+            if offsets is not None and len(offsets) > 1:
+                connectivity = arrays[name + "_connectivity"]
+                if offsets.dtype != connectivity.dtype:
+                    offsets = offsets.astype(connectivity.dtype)
+                setter = getattr(self.vtk_polydata, "Set" + vtk_name)
+                setter(cell_array_from_csr(offsets, connectivity))
+        for name in ("point_colors", "polygon_colors"):
+            if name in arrays:
+                setattr(self, name, arrays[name])
+
+        self.color_source = header["color_source"]
+        self.color_mode = header["color_mode"]
+        scalar_range = header["scalar_range"]
+        self.scalar_range = ... if scalar_range is None else scalar_range
+        return self
+
+    def to_shared_memory(self, name=None):
+        """Copy this polydata into a block of shared memory so that another
+        process can use it via `from_shared_memory()` without any further
+        copying or pickling.
+
+        :param name: The name of the block, defaults to a random name.
+        :type name: str
+
+        :return: The shared memory block. Pass its ``name`` to the other process.
+        :rtype: multiprocessing.shared_memory.SharedMemory
+
+        If a block called **name** already exists, it is overwritten in-place
+        and its version counter (see `shared_memory_version`) is incremented
+        so that readers can tell that there is fresh data. Readers may still be
+        using the old arrays so the new data must have exactly the same array
+        shapes and dtypes. Otherwise, use a new name. If no such block exists,
+        a new block is created. The
+        process which created the block owns it and should call its
+        ``unlink()`` method once no process needs it any more.
+
+        .. code-block:: python
+
+            # In the worker process:
+            block = polydata.to_shared_memory("mesh")
+
+            # In the viewer process:
+            polydata = vpl.PolyData.from_shared_memory("mesh")
+            ...
+            if polydata.shared_memory_stale:
+                polydata = vpl.PolyData.from_shared_memory("mesh")
+
+        Requires Python >= 3.8.
+
+        """
+        from multiprocessing.shared_memory import SharedMemory
+
+        header, arrays = self._layout()
+        layout = header["arrays"]
+        data_size = header["size"]
+        header = json.dumps(header).encode()
+        start = _round_up(_SHARED_PREFIX.size + len(header))
+        size = start + data_size
+
+        block = None
+        if name is not None:
+            try:
+                block = _open_shared_memory(name)
+            except FileNotFoundError:
+                pass
+        if block is None:
+            block = SharedMemory(name, create=True, size=max(size, 1))
+            version = 0
+        else:
+            version, old_size = _read_shared_prefix(block)
+            old_start = _round_up(_SHARED_PREFIX.size + old_size)
+            old = bytes(block.buf[_SHARED_PREFIX.size:][:old_size])
+            # Compare the layouts in the same (JSON) form.
+            if old_start != start or json.loads(old)["arrays"] \
+                    != json.loads(json.dumps(layout)):
+                raise ValueError(
+                    "The arrays of this polydata are laid out "
+                    "differently to those in the existing shared "
+                    "memory block {!r} which other processes may "
+                    "still be reading. Use a new name.".format(name))
+
+        buffer = np.frombuffer(block.buf, np.uint8)
+        # An odd version means that a write is in progress.
+        _SHARED_PREFIX.pack_into(block.buf, 0, _SHARED_MEMORY_MAGIC,
+                                 version + 1, 0)
+        buffer[_SHARED_PREFIX.size:_SHARED_PREFIX.size + len(header)] = \
+            np.frombuffer(header, np.uint8)
+        for (name_, array) in arrays.items():
+            offset = start + layout[name_][0]
+            buffer[offset:offset + array.nbytes] = \
+                array.reshape(-1).view(np.uint8)
+        del buffer
+        _SHARED_PREFIX.pack_into(block.buf, 0, _SHARED_MEMORY_MAGIC,
+                                 version + 2, len(header))
+        return block
+
+    @classmethod
+    def from_shared_memory(cls, name):
+        """Wrap a block of shared memory written by `to_shared_memory()`
+        (possibly by another process).
+
+        :param name: The name of the block.
+        :type name: str
+
+        :rtype: `PolyData`
+
+        No data is copied. Changes made to the polydata in-place (e.g. by
+        `update_points()`) are therefore visible to every process using the
+        block. Check `shared_memory_stale` to see if the block has since been
+        rewritten.
+
+        """
+        block = _open_shared_memory(name)
+        # VTK may hold onto the arrays for longer than this block lives. Closing
+        # the block would then raise a BufferError. Leave unmapping it to the
+        # OS but close its file descriptor (POSIX only) which isn't needed once
+        # mapped.
+        block.close = lambda: None
+        if getattr(block, "_fd", -1) >= 0:
+            os.close(block._fd)
+            block._fd = -1
+
+        while True:
+            version, header_size = _read_shared_prefix(block)
+            if version % 2:
+                # Wait for an in-progress write to finish.
+                time.sleep(.001)
+                continue
+            try:
+                self = cls._from_shared_layout(block, header_size)
+            except (ValueError, KeyError, TypeError):
+                # A write which started part way through reading can leave
+                # garbage. Only raise if there was no such write.
+                if _read_shared_prefix(block)[0] == version:
+                    raise
+                continue
+            # Likewise, a write may have started since - retry if so.
+            if _read_shared_prefix(block)[0] == version:
+                break
+
+        self._shared_memory = block, version
+        return self
+
+    @classmethod
+    def _from_shared_layout(cls, block, header_size):
+        start = _SHARED_PREFIX.size
+        header = json.loads(bytes(block.buf[start:start + header_size]))
+        start = _round_up(start + header_size)
+
+        arrays = {}
+        for (name, (offset, dtype, shape)) in header["arrays"].items():
+            arrays[name] = np.frombuffer(block.buf, dtype, int(np.prod(shape)),
+                                         start + offset).reshape(shape)
+        return cls._from_layout(header, arrays)
+
+    @property
+    def shared_memory_version(self):
+        """The version counter of the shared memory block this polydata was
+        read from by `from_shared_memory()` or `None` if it wasn't. The counter
+        goes up by 2 each time the block is rewritten. It is odd whilst a
+        rewrite is in progress."""
+        if self._shared_memory is None:
+            return None
+        return _read_shared_prefix(self._shared_memory[0])[0]
+
+    @property
+    def shared_memory_stale(self):
+        """`True` if the shared memory block this polydata was read from has
+        been written to since. Reload it with `from_shared_memory()`."""
+        if self._shared_memory is None:
+            return False
+        return self.shared_memory_version != self._shared_memory[1]
+
+    def _copy_settings_to(self, new):
+        new.texture_map = self.texture_map
+        new._smooth = self._smooth
+        new._auto_scalar_range = self._auto_scalar_range
+        # Only copy these if they have been overridden per-instance.
+        for key in ("compact_cell_ids", "points_dtype", "quantize_colors"):
+            if key in vars(self):
+                setattr(new, key, getattr(self, key))
+        new.mapper.SetScalarMode(self.mapper.GetScalarMode())
+        new.mapper.SetColorMode(self.mapper.GetColorMode())
+        new.mapper.SetScalarRange(self.mapper.GetScalarRange())
+        new.mapper.SetLookupTable(self.mapper.GetLookupTable())
+
+    def _buffers(self):
+        """Yield every vtkDataArray holding this polydata's data."""
+        points = self.vtk_polydata.GetPoints()
+        if points is not None:
+            yield points.GetData()
+
+        for cells in (self.vtk_polydata.GetLines(),
+                      self.vtk_polydata.GetPolys()):
+            if vtk.VTK_MAJOR_VERSION >= 9:
+                yield cells.GetOffsetsArray()
+                yield cells.GetConnectivityArray()
+            else:
+                yield cells.GetData()
+
+        for data in (self.vtk_polydata.GetPointData(),
+                     self.vtk_polydata.GetCellData()):
+            for i in range(data.GetNumberOfArrays()):
+                yield data.GetArray(i)
+
+    @property
+    def nbytes(self):
+        """The total memory in bytes used by this polydata's arrays. This
+        includes the points, cells, colors and lookup table, the numpy arrays
+        kept alive to back them and any spare capacity reserved by the
+        append_*() methods. Memory shared between arrays is counted once.
+
+        .. seealso:: `vtkplotlib.figure.memory_report()` to see where the
+                     memory is used.
+
+        """
+        counter = _ByteCounter()
+        return sum(counter.add(array)[0] for (name, array) in self._arrays())
+
+    def _arrays(self):
+        """Yield a ``(name, numpy_array)`` pair for each block of memory this
+        polydata holds. The arrays VTK uses come first followed by the numpy
+        arrays kept alive to back them. The latter are mostly the same memory
+        as the former but can also be stale copies or spare capacity."""
+        points = self.vtk_polydata.GetPoints()
+        if points is not None:
+            data = points.GetData()
+            if not _is_soa(data):
+                yield "points", vtk_to_numpy(data)
+            else:
+                # Reading other SOA arrays would create a copy so they can't
+                # be measured without adding to the memory in use.
+                for (axis, component) in zip("xyz",
+                                             _soa_components(data) or ()):
+                    yield "points." + axis, component
+
+        for (name, cells) in (("lines", self.vtk_polydata.GetLines()),
+                              ("polygons", self.vtk_polydata.GetPolys())):
+            if not cells.GetNumberOfCells():
+                # Possibly a placeholder shared by all vtkPolyDatas.
+                continue
+            if vtk.VTK_MAJOR_VERSION >= 9:
+                yield name + "_offsets", vtk_to_numpy(cells.GetOffsetsArray())
+                yield name + "_connectivity", \
+                    vtk_to_numpy(cells.GetConnectivityArray())
+            else:
+                yield name, vtk_to_numpy(cells.GetData())
+
+        for (prefix, data) in (("point", self.vtk_polydata.GetPointData()),
+                               ("polygon", self.vtk_polydata.GetCellData())):
+            for i in range(data.GetNumberOfArrays()):
+                array = data.GetArray(i)
+                if array is None:
+                    continue
+                if array is data.GetScalars():
+                    name = prefix + "_colors"
+                else:
+                    name = array.GetName() or "{}_data[{}]".format(prefix, i)
+                yield name, vtk_to_numpy(array)
+
+        table = self.mapper.GetLookupTable()
+        if table is not None and table.GetTable().GetNumberOfValues():
+            yield "cmap", vtk_to_numpy(table.GetTable())
+
+        retained = [("_vertices", getattr(self, "_vertices", None)),
+                    ("_colors", getattr(self, "_colors", None))]
+        for (name, (buffers, _)) in self._growables.items():
+            if isinstance(buffers, _GrowableArray):
+                buffers = (buffers,)
+            for buffer in buffers:
+                retained.append(
+                    ("_growables[{!r}]".format(name), buffer.buffer))
+        for (name, array) in retained:
+            if isinstance(array, list):
+                for i in array:
+                    yield name, i
+            elif array is not None:
+                yield name, array
+
+    def _view(self, data):
+        """Convert a vtkDataArray to numpy. The result is read-only if the
+        array is shared with a `shallow_copy()`."""
+        if _is_soa(data):
+            components = _soa_components(data)
+            if components is None:
+                array = vtk_to_numpy(data)
+            else:
+                array = np.stack(components, axis=-1)
+            array.flags.writeable = False
+            return array
+        array = vtk_to_numpy(data)
+        if self._is_shared(data):
+            array = array.view()
+            array.flags.writeable = False
+        return array
 
     def quick_show(self):
 
@@ -383,34 +1519,501 @@ class PolyData(object):
 
     def __add__(self, other):
         assert isinstance(other, self.__class__)
-        new = self.__class__()
-        points = [self.points, other.points]
-        points[1] = points[1].astype(points[0].dtype)
-        new.points = np.concatenate(points)
+        return self.concatenate([self, other])
 
-        for attr in ("polygons", "lines"):
-            lines = [getattr(self, attr), getattr(other, attr)]
-            try:
-                lines[1] = lines[1] + len(points[0])
-            except BaseException:
-                for i in lines[1]:
-                    i += len(points[0])
+    @classmethod
+    def concatenate(cls, polydatas):
+        """Merge many polydatas into one.
 
-            try:
-                lines = np.concatenate(lines)
-            except ValueError:
-                lines = list(lines[0]) + list(lines[1])
+        :param polydatas: The polydatas to merge.
+        :type polydatas: iterable of `PolyData`
+
+        :return: A new polydata containing every point, line and polygon.
+        :rtype: `PolyData`
 
-            setattr(new, attr, lines)
+        Each output array is allocated once so, unlike repeatedly using ``+``,
+        this scales linearly with the number of polydatas. Point and polygon
+        colors are carried over if any input has them (inputs without get
+        zeros). Which input each line or polygon came from is recorded in
+        the output's `part_ids`.
 
-        colors = [self.point_colors, other.point_colors]
-        for i in range(2):
-            if colors[i] is None:
-                colors[i] = np.zeros(len(points[i]))
-        new.point_colors = np.concatenate(colors)
+        .. code-block:: python
+
+            import vtkplotlib as vpl
+            import numpy as np
+
+            parts = [
+                vpl.scatter(np.random.uniform(-10, 10, 3), fig=None).polydata
+                for i in range(100)
+            ]
+            merged = vpl.PolyData.concatenate(parts)
+            merged.to_plot()
+            vpl.show()
+
+        """
+        polydatas = list(polydatas)
+        new = cls()
+        if not polydatas:
+            return new
+
+        points = [i.points for i in polydatas]
+        points = [np.empty((0, 3)) if i is None else i for i in points]
+        point_starts = np.cumsum([0] + [len(i) for i in points])
+        new.points = _concatenate_into(points)
+
+        cell_colors = [i.polygon_colors for i in polydatas]
+        cell_counts = {}
+        for attr in ("lines", "polygons"):
+            offsets = [getattr(i, attr + "_offsets") for i in polydatas]
+            lengths = [np.diff(i) for i in offsets]
+            cell_counts[attr] = np.array([len(i) for i in lengths])
+
+            connectivity = [
+                getattr(i, attr + "_connectivity") for i in polydatas
+            ]
+            connectivity = _concatenate_into(connectivity, point_starts[:-1],
+                                             new.cell_ids_dtype)
+            lengths = _concatenate_into(lengths)
+            if len(lengths):
+                setattr(new, attr, RaggedCells(lengths, connectivity))
+
+        # Cell data is ordered lines first then polygons. So each input's cell
+        # data has to be split in two to be merged.
+        part_ids = np.arange(len(polydatas), dtype=np.int32)
+        part_ids = np.concatenate([
+            np.repeat(part_ids, cell_counts["lines"]),
+            np.repeat(part_ids, cell_counts["polygons"]),
+        ])
+        new._set_part_ids(part_ids)
+
+        point_colors = [i.point_colors for i in polydatas]
+        if any(i is not None for i in point_colors):
+            new.point_colors = _concatenate_into(
+                _fill_missing(point_colors, [len(i) for i in points]))
+
+        if any(i is not None for i in cell_colors):
+            cell_colors = _fill_missing(
+                cell_colors, cell_counts["lines"] + cell_counts["polygons"])
+            split = list(zip(cell_colors, cell_counts["lines"]))
+            line_colors = [colors[:n] for (colors, n) in split]
+            polygon_colors = [colors[n:] for (colors, n) in split]
+            new.polygon_colors = _concatenate_into(line_colors + polygon_colors)
+
+        if polydatas[0].color_source is not None:
+            new.color_source = polydatas[0].color_source
 
         return new
 
+    @property
+    def part_ids(self):
+        """For a polydata created by `concatenate()`, the index of the input
+        polydata each line then each polygon came from. Otherwise `None`."""
+        array = self.vtk_polydata.GetCellData().GetArray("part_ids")
+        if array is None:
+            return None
+        return vtk_to_numpy(array)
+
+    def _set_part_ids(self, part_ids):
+        array = numpy_to_vtk(part_ids)
+        array._numpy_reference = part_ids
+        array.SetName("part_ids")
+        self.vtk_polydata.GetCellData().AddArray(array)
+
+    def append_points(self, points, colors=None):
+        """Add points to the end of `points` without reallocating everything.
+
+        :param points: The new points.
+        :type points: numpy.ndarray
+
+        :param colors: Point colors for the new points. Required if and only if this polydata already has `point_colors`.
+        :type colors: numpy.ndarray
+
+        Points are stored in a buffer which doubles in capacity whenever it is
+        full. This makes appending a few points at a time, e.g. from a live
+        feed, cost the size of the new data rather than the size of the whole
+        polydata.
+
+        .. code-block:: python
+
+            import vtkplotlib as vpl
+            import numpy as np
+
+            polydata = vpl.PolyData()
+            plot = polydata.to_plot()
+
+            for i in range(100):
+                start = polydata.vtk_polydata.GetNumberOfPoints()
+                polydata.append_points(np.random.random((10, 3)))
+                polydata.append_lines(np.arange(start, start + 10)[np.newaxis])
+
+            vpl.show()
+
+        """
+        old_colors = self.point_colors
+        if (old_colors is None) != (colors is None) and self.points is not None:
+            raise ValueError("`colors` must be given if and only if this "
+                             "polydata has `point_colors`.")
+
+        points = np.asarray(points).reshape((-1, 3))
+        vtk_points = self.vtk_polydata.GetPoints()
+        growable = self._growable("points", vtk_points and vtk_points.GetData(),
+                                  points, self.points_dtype)
+        self.points = growable.extend(points)
+        self._growables["points"] = \
+            growable, self.vtk_polydata.GetPoints().GetData()
+
+        if colors is None:
+            return
+        point_data = self.vtk_polydata.GetPointData()
+        if old_colors is None:
+            # There are no existing colors to append to. Let the
+            # `point_colors` setter work out what they mean.
+            growable = _GrowableArray(colors)
+            self.point_colors = growable.array
+        else:
+            colors = np.reshape(colors, (len(points),) + old_colors.shape[1:])
+            growable = self._growable("point_colors", point_data.GetScalars(),
+                                      colors, old_colors.dtype)
+            array = growable.extend(colors)
+            vtk_colors = numpy_to_vtk(array)
+            vtk_colors._numpy_ref = array
+            point_data.SetScalars(vtk_colors)
+        self._growables["point_colors"] = growable, point_data.GetScalars()
+
+    def update_points(self, index, values):
+        """Overwrite some of the `points` in-place.
+
+        :param index: Which points to overwrite. Anything that can index a numpy array.
+        :type index: int or slice or numpy.ndarray
+
+        :param values: The new points.
+        :type values: numpy.ndarray
+
+        This is equivalent to ``polydata.points[index] = values`` except
+        that it also works on points shared with a `shallow_copy()` (the shared
+        points are copied first) and it tells VTK that the points have changed.
+        Only the points array is marked as modified. Nothing is reallocated
+        and the colors and cells are left alone. Use it for animating
+        deformations of large meshes.
+
+        .. code-block:: python
+
+            import vtkplotlib as vpl
+            import numpy as np
+
+            plot = vpl.mesh_plot(vpl.data.get_rabbit_stl())
+            polydata = plot.polydata
+            fig = vpl.gcf()
+            fig.show(block=False)
+
+            # Gradually drag the first 100 vertices sideways.
+            for i in range(10):
+                polydata.update_points(slice(100), polydata.points[:100] + 1)
+                fig.update()
+
+        """
+        if self.vtk_polydata.GetPoints() is None:
+            raise ValueError("There are no points to update.")
+        data = self._writable_data(self.vtk_polydata.GetPoints().GetData())
+        if _is_soa(data):
+            components = _soa_components(data)
+            if components is None:
+                # Not from set_points_soa() so there's no writable memory.
+                # Switch to regular interleaved points.
+                self.points = self.points
+                data = self.vtk_polydata.GetPoints().GetData()
+            else:
+                values = np.asarray(values)
+                values = np.broadcast_to(values, values.shape[:-1] + (3,))
+                for (i, axis) in enumerate(components):
+                    axis[index] = values[..., i]
+                data.Modified()
+                self._geometry_changed()
+                return
+        self.points[index] = values
+        data.Modified()
+        self._geometry_changed()
+
+    def update_point_colors(self, index, values):
+        """Overwrite some of the `point_colors` in-place. See
+        `update_points()`. **values** must already be in the form they are
+        stored in (e.g. RGB rather than texture coordinates)."""
+        self._update_colors("point_colors", index, values)
+
+    def update_polygon_colors(self, index, values):
+        """Overwrite some of the `polygon_colors` in-place. See
+        `update_points()`. **values** must already be in the form they are
+        stored in (e.g. RGB rather than texture coordinates)."""
+        self._update_colors("polygon_colors", index, values)
+
+    def _update_colors(self, name, index, values):
+        data = self._colors_attributes(name).GetScalars()
+        if data is None:
+            raise ValueError("There are no colors to update.")
+        data = self._writable_data(data)
+        array = vtk_to_numpy(data)
+
+        # The cached scalar range stays valid if the overwritten values were
+        # not the minimum or maximum. Then only the new values need checking.
+        cached = self._colors_ranges.get(name)
+        incremental = cached is not None and cached[0] is data \
+            and cached[1] == data.GetMTime() and cached[2] is not None
+        if incremental:
+            low, high = cached[2]
+            old = array[index]
+            incremental = old.size == 0 or \
+                (np.fmin.reduce(old, None) > low and
+                 np.fmax.reduce(old, None) < high)
+
+        array[index] = values
+        data.Modified()
+
+        if incremental:
+            new = array[index]
+            if new.size:
+                low = min(low, np.fmin.reduce(new, None))
+                high = max(high, np.fmax.reduce(new, None))
+            self._colors_ranges[name] = data, data.GetMTime(), (low, high)
+
+        if self._auto_scalar_range and self.color_source == name:
+            self.scalar_range = Ellipsis
+
+    def _share(self, arrays=(), other=None):
+        """Mark the vtkDataArrays **arrays** as shared with the polydata
+        **other** or with something outside of vtkplotlib if **other** is
+        None. Also forget any previously shared arrays which have since been
+        replaced or whose other polydata has been deleted so that they can be
+        freed or written to."""
+        ref = other and weakref.ref(other)
+        shared = self._shared + [(i, ref) for i in arrays]
+        in_use = list(self._buffers())
+        self._shared = [(data, ref) for (data, ref) in shared
+                        if _alive(ref) and any(data is i for i in in_use)]
+
+    def _is_shared(self, data):
+        """Is the vtkDataArray **data** still shared with anything?"""
+        return any(data is i and _alive(ref) for (i, ref) in self._shared)
+
+    def _writable_data(self, data):
+        """If the vtkDataArray **data** is shared with a `shallow_copy()`,
+        replace it with a private copy. Returns whichever array is in use."""
+        if not self._is_shared(data):
+            return data
+
+        components = _soa_components(data)
+        if components is not None:
+            self.set_points_soa(*(np.copy(i) for i in components))
+            return self.vtk_polydata.GetPoints().GetData()
+
+        copy = data.NewInstance()
+        copy.DeepCopy(data)
+        if data is self.vtk_polydata.GetPoints().GetData():
+            # The vtkPoints object itself is also shared.
+            points = vtk.vtkPoints()
+            points.SetData(copy)
+            self.vtk_polydata.SetPoints(points)
+            self._points_view = None
+        else:
+            for attributes in (self.vtk_polydata.GetPointData(),
+                               self.vtk_polydata.GetCellData()):
+                if attributes.GetScalars() is data:
+                    attributes.SetScalars(copy)
+        self._share()
+        return copy
+
+    def weld(self, tolerance=0):
+        """Merge duplicate points and rewrite `lines` and `polygons` to use
+        the merged points. This turns *triangle soup* (such as an STL file,
+        where every triangle has its own copy of each corner) into an
+        indexed mesh with roughly a sixth as many points.
+
+        :param tolerance: How close points must be to be merged, defaults to 0 (exact duplicates only).
+        :type tolerance: float
+
+        With a non-zero **tolerance**, points are merged if they round to the
+        same point on a grid with spacing **tolerance**. This is fast but
+        approximate: two points closer than **tolerance** are occasionally
+        left unmerged if they fall either side of a grid line.
+
+        Each merged point keeps the position, `point_colors` and any other
+        per-point data of the first of the points it replaces. Per-cell data,
+        such as `polygon_colors`, is unaffected.
+
+        """
+        points = self.points
+        if points is None or not len(points):
+            return
+
+        if tolerance:
+            keys = np.floor(points / tolerance + .5).astype(np.int64)
+        else:
+            # Adding 0.0 turns any -0.0 into 0.0 so that they're
+            # byte-for-byte equal.
+            keys = np.ascontiguousarray(points + 0.0)
+        keys = keys.view(np.dtype((np.void, keys.dtype.itemsize * 3))).ravel()
+
+        _, first, inverse = np.unique(keys, return_index=True,
+                                      return_inverse=True)
+        # Keep the points in the order they first appeared.
+        order = np.argsort(first, kind="stable")
+        ranks = np.empty_like(order)
+        ranks[order] = np.arange(len(order))
+        new_ids = ranks[inverse.ravel()]
+        kept = first[order]
+
+        dtype = self.cell_ids_dtype
+        for (vtk_name, name) in (("Lines", "lines"), ("Polys", "polygons")):
+            offsets = getattr(self, name + "_offsets")
+            if len(offsets) > 1:
+                connectivity = getattr(self, name + "_connectivity")
+                setter = getattr(self.vtk_polydata, "Set" + vtk_name)
+                setter(
+                    cell_array_from_csr(offsets.astype(dtype),
+                                        new_ids[connectivity].astype(dtype)))
+
+        point_data = self.vtk_polydata.GetPointData()
+        _take_arrays(point_data, point_data, kept)
+
+        # Do this last so that anything derived from the points and cells
+        # (such as normals) is rebuilt from both.
+        self.points = points[kept]
+        if self._auto_scalar_range:
+            self.scalar_range = ...
+
+    def extract_cells(self, mask):
+        """Create a polydata containing only some of the `lines` and
+        `polygons`.
+
+        :param mask: Which cells to keep. Either a boolean mask or an array of cell ids.
+        :type mask: numpy.ndarray
+
+        :return: A polydata with the selected cells.
+        :rtype: `PolyData`
+
+        Cell ids count the `lines` then the `polygons`, the same as
+        `polygon_colors`. The points and per-point data aren't copied but are
+        shared with the new polydata, so in-place changes such as
+        `update_points()` affect both. Only the connectivity of the selected
+        cells and their per-cell data are built anew.
+
+        .. code-block:: python
+
+            # Keep only the polygons which face upwards.
+            upwards = polydata.extract_cells(polydata.polygon_normals[:, 2] > 0)
+
+        """
+        lines = self.vtk_polydata.GetLines().GetNumberOfCells()
+        cells = self.vtk_polydata.GetNumberOfCells()
+
+        mask = np.asarray(mask)
+        if mask.dtype == bool:
+            if mask.shape != (cells,):
+                raise ValueError(
+                    "A boolean `mask` must have shape ({},) to match the "
+                    "number of cells. Not {}.".format(cells, mask.shape))
+            ids = np.flatnonzero(mask)
+        else:
+            # Normalise any negative ids and check that they're in range.
+            ids = np.arange(cells)[np.asarray(mask, np.intp).ravel()]
+
+        new = self.__class__()
+        new.vtk_polydata.SetPoints(self.vtk_polydata.GetPoints())
+        new.vtk_polydata.GetPointData().ShallowCopy(
+            self.vtk_polydata.GetPointData())
+        _take_arrays(self.vtk_polydata.GetCellData(),
+                     new.vtk_polydata.GetCellData(),
+                     np.concatenate([ids[ids < lines], ids[ids >= lines]]))
+
+        dtype = self.cell_ids_dtype
+        selections = [
+            ("Lines", "lines", ids[ids < lines]),
+            ("Polys", "polygons", ids[ids >= lines] - lines),
+        ]
+        for (vtk_name, name, selected) in selections:
+            if len(selected):
+                offsets, connectivity = _take_cells(
+                    getattr(self, name + "_offsets").astype(dtype),
+                    getattr(self, name + "_connectivity"), selected)
+                setter = getattr(new.vtk_polydata, "Set" + vtk_name)
+                setter(cell_array_from_csr(offsets, connectivity.astype(dtype)))
+
+        self._copy_settings_to(new)
+        return new
+
+    def to_strips(self):
+        """Convert the `polygons` into triangle strips using VTK's
+        vtkStripper. Strips are the fastest form of polygons for VTK to
+        render as each triangle after the first in a strip needs only one more
+        point id rather than three.
+
+        :return: A new polydata with strips instead of polygons.
+        :rtype: `PolyData`
+
+        The result is cached and reused until this polydata is modified. The
+        points and per-point data are shared with this polydata.
+        Triangles only join into strips if they share points so use `weld()`
+        first on triangle soup. Strips can't be given per-polygon colors so
+        `polygon_colors` is dropped.
+
+        """
+        mtime = self.vtk_polydata.GetMTime()
+        cached = self._strips_cache
+        if cached is None or cached[0] != mtime:
+            stripper = vtk.vtkStripper()
+            stripper.SetInputData(self.vtk_polydata)
+            stripper.Update()
+            strips = self.__class__(stripper.GetOutput())
+            self._copy_settings_to(strips)
+            self._strips_cache = cached = mtime, strips
+        return cached[1]
+
+    def append_lines(self, lines):
+        """Add lines to the end of `lines`. **lines** may be in any format
+        accepted by `lines`. See `append_points()`."""
+        self._append_cells("Lines", "lines", lines)
+
+    def append_polygons(self, polygons):
+        """Add polygons to the end of `polygons`. **polygons** may be in any
+        format accepted by `polygons`. See `append_points()`."""
+        self._append_cells("Polys", "polygons", polygons)
+
+    def _append_cells(self, vtk_name, name, cells):
+        offsets, connectivity = to_offsets_connectivity(cells,
+                                                        self.cell_ids_dtype)
+
+        current = getattr(self.vtk_polydata, "Get" + vtk_name)()
+        cached = self._growables.get(name)
+        if cached is not None and cached[1] is current \
+                and cached[0][1].buffer.dtype == connectivity.dtype:
+            buffers = cached[0]
+        else:
+            buffers = (
+                _GrowableArray(getattr(self, name + "_offsets"),
+                               connectivity.dtype),
+                _GrowableArray(getattr(self, name + "_connectivity"),
+                               connectivity.dtype),
+            )
+
+        cell_array = cell_array_from_csr(
+            buffers[0].extend(offsets[1:] + buffers[1].size),
+            buffers[1].extend(connectivity))
+        getattr(self.vtk_polydata, "Set" + vtk_name)(cell_array)
+        self._growables[name] = buffers, cell_array
+        self._geometry_changed()
+
+    def _growable(self, name, data, template, dtype=None):
+        """Get the append buffer behind the vtkDataArray **data**. If **data**
+        wasn't produced by that buffer, then start a new buffer with a copy of
+        **data**. **template** is an example of what will be appended."""
+        cached = self._growables.get(name)
+        if cached is not None and cached[1] is data:
+            return cached[0]
+        if data is None:
+            initial = np.empty((0,) + template.shape[1:], template.dtype)
+        else:
+            initial = self._view(data).reshape((-1,) + template.shape[1:])
+        return _GrowableArray(initial, dtype)
+
     @property
     def color_source(self):
         """Use to select either point_colors or polygon_colors"""
@@ -450,16 +2053,43 @@ class PolyData(object):
     @scalar_range.setter
     def scalar_range(self, range=None):
         if range is None or range is Ellipsis:
-            if self.color_source == "point_colors":
-                range = self.point_colors
+            self._auto_scalar_range = True
+            range = self._colors_range(self.color_source)
+            if range is None:
+                return
+        else:
+            self._auto_scalar_range = False
+            range = np.nanmin(range), np.nanmax(range)
 
-            elif self.color_source == "polygon_colors":
-                range = self.polygon_colors
+        self.mapper.SetScalarRange(*range)
 
-            if range is None or range is Ellipsis:
-                return
+    def _colors_attributes(self, name):
+        if name == "point_colors":
+            return self.vtk_polydata.GetPointData()
+        return self.vtk_polydata.GetCellData()
+
+    def _colors_range(self, name):
+        """Get the ``(min, max)`` of ``point_colors`` or ``polygon_colors``
+        ignoring NaNs. This is cached until the array is replaced or marked as
+        modified."""
+        if name is None:
+            return None
+        data = self._colors_attributes(name).GetScalars()
+        if data is None:
+            return None
 
-        self.mapper.SetScalarRange(np.nanmin(range), np.nanmax(range))
+        cached = self._colors_ranges.get(name)
+        if cached is None or cached[0] is not data \
+                or cached[1] != data.GetMTime():
+            # VTK finds the min and max together in one (multithreaded) pass.
+            ranges = [
+                data.GetRange(i) for i in range(data.GetNumberOfComponents())
+            ]
+            low, high = min(i[0] for i in ranges), max(i[1] for i in ranges)
+            # If everything is NaN then VTK gives low > high.
+            found = (low, high) if low <= high else None
+            cached = self._colors_ranges[name] = data, data.GetMTime(), found
+        return cached[2]
 
     @property
     def cmap(self):
@@ -475,5 +2105,8 @@ class PolyData(object):
         # This resets the cmap to the
         self.cmap.ForceBuild()
 
-    _keys = [key for (key, val) in vars().items() if isinstance(val, property)]
+    _keys = [
+        key for (key, val) in vars().items()
+        if isinstance(val, property) and val.fset is not None
+    ]
     _keys.remove("cmap")